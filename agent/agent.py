@@ -16,12 +16,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 
 import asyncio
-import json
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, TypedDict, Annotated
+from typing import Dict, List, Any, Optional, Tuple, TypedDict, Annotated
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 import sys
+import time
+import uuid
 
+import orjson
+from cachetools import TTLCache
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
@@ -30,13 +36,15 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_aws import ChatBedrock
 
 from client_side.utils.mcp_tools_models import MCPToolResult
-from client_side.client import MCPClient
+from client_side.client import MCPClient, MCPClientPool
 
 from utils import (
     _format_tools_for_prompt,
     _format_results_for_prompt,
     _parse_json_response,
+    _trim_results,
 )
+from cache import SemanticResponseCache, hash_tool_results
 
 
 # Setup logging
@@ -46,6 +54,140 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Static prompt text shared by every request. Kept in stable system blocks
+# marked with cache_control so Bedrock can serve the prefix from its prompt
+# cache instead of re-processing it on each call.
+ANALYSIS_SYSTEM_PROMPT = """You are a strategic tool selection AI that responds only with valid JSON.
+
+You are an expert AI agent that analyzes user requests and selects appropriate MCP tools.
+
+Analyze each request and provide a JSON response with your analysis and tool selection.
+
+Response format (must be valid JSON):
+{
+    "task_analysis": "Brief description of what the user wants to accomplish",
+    "complexity": "simple",
+    "selected_tools": [
+        {
+            "tool": "tool_name",
+            "parameters": {"param_name": "param_value"},
+            "reason": "Why this tool is needed",
+            "sequence": 1,
+            "critical": false
+        }
+    ],
+    "execution_plan": "Brief plan for executing the tools",
+    "expected_outcome": "What the user should expect"
+}
+
+Rules for tool selection:
+- Only use tools that are actually available
+- Use minimum necessary tools to accomplish the task
+- For research requests: use web_search first, then filesystem to save results
+- For file operations: use filesystem tool
+- For data queries: use database tool
+- For code: use code_execution tool
+- For API calls: use api_client tool
+
+Be strategic and only select tools you are confident will help accomplish the user's goal."""
+
+RESPONSE_SYSTEM_PROMPT = """You are a helpful AI assistant providing results to a user.
+
+Generate a comprehensive, helpful response to the user based on the tool execution results.
+
+Guidelines for the response:
+1. Directly address the user's original request
+2. Highlight successful operations and key findings
+3. Mention any errors or limitations encountered
+4. Provide actionable information or next steps
+5. Be conversational and user-friendly
+6. Include relevant details from the tool outputs
+7. If files were created, mention their locations
+8. If data was found, summarize key insights
+
+Create a response that feels natural and complete, as if you personally completed the user's request."""
+
+
+# Canned replies for requests that never need a Bedrock call
+_DIRECT_RESPONSES = {
+    "hi": "Hello! How can I help you today?",
+    "hello": "Hello! How can I help you today?",
+    "hey": "Hello! How can I help you today?",
+    "help": (
+        "I can search for information, work with files, query the sample "
+        "database, make API calls, and more. Just describe what you need."
+    ),
+    "thanks": "You're welcome! Let me know if there's anything else.",
+    "thank you": "You're welcome! Let me know if there's anything else.",
+}
+
+# Requests longer than this are refused before reaching Bedrock
+MAX_REQUEST_CHARS = 8000
+
+
+def _classify_direct(user_request: str) -> Optional[str]:
+    """Return a direct response for trivial requests, or None
+
+    Greetings, empty input, and oversized requests are all answerable
+    without entering the workflow or paying for an LLM call.
+    """
+    stripped = user_request.strip()
+    if not stripped:
+        return "Please enter a request so I can help you."
+    if len(stripped) > MAX_REQUEST_CHARS:
+        return (
+            "Your request is too long for me to process. Please shorten it "
+            f"to under {MAX_REQUEST_CHARS} characters."
+        )
+    return _DIRECT_RESPONSES.get(stripped.lower().rstrip("!.?"))
+
+
+class CircuitBreakerOpen(Exception):
+    """Raised when a circuit breaker is open and the call is short-circuited"""
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures instead of paying full timeouts
+
+    Opens after `threshold` consecutive failures and lets the next call
+    through again once `reset_after` seconds have passed.
+    """
+
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    def is_open(self) -> bool:
+        """Whether calls should currently be short-circuited"""
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            # Half-open: allow the next call to probe the upstream
+            self.opened_at = None
+            self.failures = 0
+            return False
+        return True
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold and self.opened_at is None:
+            self.opened_at = time.monotonic()
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+
+def _cached_system_blocks(*texts: str) -> List[Dict[str, Any]]:
+    """Build system content blocks marked for Bedrock prompt caching"""
+    return [
+        {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+        for text in texts
+    ]
+
+
 # Agent State Definition
 class AgentState(TypedDict):
     messages: Annotated[List, add_messages]
@@ -67,21 +209,64 @@ class BedrockMCPAgent:
     def __init__(
         self,
         model_id: str = "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-        mcp_server_script: str = "server_side\server.py",
+        mcp_server_script: str = "server_side/server.py",
         aws_region: str = "us-east-1",
         max_steps: int = 10,
+        max_total_tool_seconds: float = 300.0,
     ):
         self.model_id = model_id
         self.mcp_server_script = mcp_server_script
         self.aws_region = aws_region
         self.max_steps = max_steps
+        self.max_total_tool_seconds = max_total_tool_seconds
 
         # Initialize Bedrock LLM
         self.llm = self._initialize_bedrock_llm()
 
-        # Initialize MCP client with STDIO server script
-        self.mcp_client = MCPClient(
-            server_script=self.mcp_server_script,
+        # MCP client is acquired lazily from the shared pool so multiple
+        # agents pointed at the same server script reuse one subprocess
+        self.mcp_client: Optional[MCPClient] = None
+
+        # Guards against concurrent reconnect attempts
+        self._connect_lock = asyncio.Lock()
+
+        # Circuit breakers for the Bedrock endpoint and individual tools
+        self._llm_breaker = CircuitBreaker()
+        self._tool_breakers: Dict[str, CircuitBreaker] = {}
+
+        # Semantic cache for generated responses
+        self.response_cache = SemanticResponseCache()
+
+        # Exact-match cache for tool-selection analysis (deterministic prompt)
+        self._analysis_cache = TTLCache(maxsize=1000, ttl=1800)
+
+        # Fallback session id for callers that pass no context; minted
+        # once so the default path keys the analysis cache stably
+        # instead of a fresh uuid defeating it on every request
+        self._default_session_id = f"session_{uuid.uuid4().hex}"
+
+        # Cached tool catalog plus its formatted prompt text
+        self._tools_cache: Optional[Tuple[float, List, str]] = None
+        self._tools_ttl = 60.0
+
+        # Compiled workflow app and its long-lived checkpointer
+        self._compiled_app = None
+        self._checkpointer_cm = None
+
+        # Set while a process_request_stream call is in flight
+        self._token_callback = None
+
+        # Dynamic prompt scaffolding, parsed once instead of per request
+        self._analysis_prompt_tmpl = (
+            "User Request: {user_message}\n\nContext: {context_json}"
+        )
+        self._response_prompt_tmpl = (
+            "Original User Request: {original_request}\n\n"
+            "Tool Execution Results:\n{results_summary}"
+        )
+        self._direct_prompt_tmpl = (
+            "The user asked: '{original_request}'\n\nNo external tools were "
+            "used. Provide a helpful response based on your knowledge."
         )
 
         # Create the LangGraph workflow
@@ -137,6 +322,96 @@ class BedrockMCPAgent:
             logger.error(f"Failed to initialize Bedrock LLM: {str(e)}")
             raise
 
+    async def _ensure_connected(self) -> bool:
+        """Connect the pooled MCP client once and reuse the warm connection"""
+        if self.mcp_client is not None and self.mcp_client.is_connected():
+            return True
+
+        async with self._connect_lock:
+            if self.mcp_client is None:
+                self.mcp_client = await MCPClientPool.acquire(
+                    self.mcp_server_script
+                )
+            if self.mcp_client.is_connected():
+                return True
+            # The tool catalog may have changed on the other side
+            self._tools_cache = None
+            return await self.mcp_client.connect()
+
+    async def _get_tools_cached(self) -> Tuple[List, str]:
+        """Return the tool catalog and its prompt text, cached with a TTL"""
+        if (
+            self._tools_cache is not None
+            and time.monotonic() - self._tools_cache[0] < self._tools_ttl
+        ):
+            return self._tools_cache[1], self._tools_cache[2]
+
+        tools = await self.mcp_client.get_available_tools()
+        # Discovery precomputes the prompt; fall back to formatting here
+        # only if the client has not populated it
+        formatted = self.mcp_client.get_tools_prompt() or _format_tools_for_prompt(
+            tools
+        )
+        self._tools_cache = (time.monotonic(), tools, formatted)
+        return tools, formatted
+
+    def _tool_breaker(self, tool_name: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker for a tool"""
+        breaker = self._tool_breakers.get(tool_name)
+        if breaker is None:
+            breaker = self._tool_breakers[tool_name] = CircuitBreaker()
+        return breaker
+
+    async def _stream_completion(self, messages) -> str:
+        """Collect a streamed Bedrock completion into a single string
+
+        Streaming keeps time-to-first-token low: each chunk is forwarded to
+        the active token callback (if any) as soon as it arrives.
+        """
+        if self._llm_breaker.is_open():
+            raise CircuitBreakerOpen("Circuit breaker open for Bedrock")
+
+        chunks = []
+        try:
+            async for chunk in self.llm.astream(messages):
+                content = chunk.content
+                if content:
+                    chunks.append(content)
+                    if self._token_callback is not None:
+                        self._token_callback(content)
+        except Exception:
+            self._llm_breaker.record_failure()
+            raise
+        self._llm_breaker.record_success()
+        return "".join(chunks)
+
+    async def _get_app(self):
+        """Compile the workflow once and reuse it with a shared checkpointer"""
+        if self._compiled_app is None:
+            # One saver connection lives as long as the compiled app,
+            # so a plain private in-memory database is all that's needed
+            self._checkpointer_cm = AsyncSqliteSaver.from_conn_string(":memory:")
+            checkpointer = await self._checkpointer_cm.__aenter__()
+            self._compiled_app = self.workflow.compile(checkpointer=checkpointer)
+        return self._compiled_app
+
+    async def close(self):
+        """Disconnect the MCP client and release resources"""
+        if self.mcp_client is not None:
+            try:
+                await MCPClientPool.release(self.mcp_server_script)
+            except Exception as e:
+                logger.warning(f"Error during MCP disconnect: {e}")
+            self.mcp_client = None
+
+        if self._checkpointer_cm is not None:
+            try:
+                await self._checkpointer_cm.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Error closing checkpointer: {e}")
+            self._checkpointer_cm = None
+            self._compiled_app = None
+
     def _create_workflow(self) -> StateGraph:
         """Create the LangGraph workflow with proper error handling"""
         workflow = StateGraph(AgentState)
@@ -172,9 +447,9 @@ class BedrockMCPAgent:
             user_message = state["messages"][-1].content
             context = state["context"]
 
-            # Try to connect to MCP server
+            # Try to connect to MCP server (no-op when already connected)
             try:
-                connected = await self.mcp_client.connect()
+                connected = await self._ensure_connected()
                 if not connected:
                     logger.warning(
                         "Could not connect to MCP server, proceeding without tools"
@@ -196,88 +471,105 @@ class BedrockMCPAgent:
                 state["step_count"] += 1
                 return state
 
-            # Get available tools
+            # Get available tools (cached between requests)
             try:
-                available_tools = await self.mcp_client.get_available_tools()
+                available_tools, tools_description = await self._get_tools_cached()
                 logger.info(
                     f"Available tools: {[tool.name for tool in available_tools]}"
                 )
             except Exception as e:
                 logger.error(f"Failed to get available tools: {e}")
                 available_tools = []
+                tools_description = _format_tools_for_prompt(available_tools)
+
+            # The analysis prompt is deterministic in the user message, the
+            # tool catalog, and the context, so identical requests can reuse
+            # a previously parsed analysis without another Bedrock call
+            context_json = orjson.dumps(
+                context,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+                default=str,
+            ).decode()
+            cache_key = hashlib.sha256(
+                (
+                    user_message
+                    + "|"
+                    + ",".join(sorted(tool.name for tool in available_tools))
+                    + "|"
+                    + context_json
+                ).encode()
+            ).hexdigest()
+
+            analysis = self._analysis_cache.get(cache_key)
+            if analysis is not None:
+                logger.info("Analysis cache hit, skipping Bedrock call")
+
+            # Static instructions live in the cached system blocks; only
+            # the user message and context stay in the uncached human turn
+            analysis_prompt = self._analysis_prompt_tmpl.format(
+                user_message=user_message, context_json=context_json
+            )
 
-            # Create analysis prompt
-            tools_description = _format_tools_for_prompt(available_tools)
-
-            analysis_prompt = f"""
-You are an expert AI agent that analyzes user requests and selects appropriate MCP tools.
-
-Available Tools:
-{tools_description}
-
-User Request: {user_message}
-
-Context: {json.dumps(context, indent=2)}
+            # Get analysis from Bedrock
+            if analysis is None:
+                try:
+                    if self._llm_breaker.is_open():
+                        raise CircuitBreakerOpen(
+                            "Circuit breaker open for Bedrock"
+                        )
+                    response = await self.llm.ainvoke(
+                        [
+                            SystemMessage(
+                                content=_cached_system_blocks(
+                                    ANALYSIS_SYSTEM_PROMPT,
+                                    f"Available Tools:\n{tools_description}",
+                                )
+                            ),
+                            HumanMessage(content=analysis_prompt),
+                        ]
+                    )
 
-Analyze this request and provide a JSON response with your analysis and tool selection.
+                    self._llm_breaker.record_success()
 
-Response format (must be valid JSON):
-{{
-    "task_analysis": "Brief description of what the user wants to accomplish",
-    "complexity": "simple",
-    "selected_tools": [
-        {{
-            "tool": "tool_name",
-            "parameters": {{"param_name": "param_value"}},
-            "reason": "Why this tool is needed",
-            "sequence": 1,
-            "critical": false
-        }}
-    ],
-    "execution_plan": "Brief plan for executing the tools",
-    "expected_outcome": "What the user should expect"
-}}
+                    # Parse the JSON response
+                    analysis = _parse_json_response(response.content)
+                    self._analysis_cache[cache_key] = analysis
 
-Rules for tool selection:
-- Only use tools that are actually available
-- Use minimum necessary tools to accomplish the task
-- For research requests: use web_search first, then filesystem to save results
-- For file operations: use filesystem tool
-- For data queries: use database tool
-- For code: use code_execution tool
-- For API calls: use api_client tool
+                except Exception as e:
+                    if not isinstance(e, CircuitBreakerOpen):
+                        self._llm_breaker.record_failure()
+                    logger.error(f"Bedrock analysis failed: {e}")
+                    # Create fallback analysis
+                    analysis = {
+                        "task_analysis": f"Process user request: {user_message[:100]}",
+                        "complexity": "simple",
+                        "selected_tools": self._create_fallback_tools(user_message),
+                        "execution_plan": "Execute tools in sequence",
+                        "expected_outcome": "Provide results to user",
+                    }
 
-Be strategic and only select tools you are confident will help accomplish the user's goal.
-"""
+            # Update state, dropping hallucinated tool names before they
+            # cost a guaranteed-failed MCP round trip
+            state["current_task"] = analysis.get("task_analysis", "Processing request")
 
-            # Get analysis from Bedrock
-            try:
-                response = await self.llm.ainvoke(
-                    [
-                        SystemMessage(
-                            content="You are a strategic tool selection AI that responds only with valid JSON."
-                        ),
-                        HumanMessage(content=analysis_prompt),
+            selected_tools = analysis.get("selected_tools", [])
+            if available_tools:
+                known_names = {tool.name for tool in available_tools}
+                dropped = [
+                    spec.get("tool")
+                    for spec in selected_tools
+                    if spec.get("tool") not in known_names
+                ]
+                if dropped:
+                    logger.warning(
+                        f"Dropping unknown tools from plan: {dropped}"
+                    )
+                    selected_tools = [
+                        spec
+                        for spec in selected_tools
+                        if spec.get("tool") in known_names
                     ]
-                )
-
-                # Parse the JSON response
-                analysis = _parse_json_response(response.content)
-
-            except Exception as e:
-                logger.error(f"Bedrock analysis failed: {e}")
-                # Create fallback analysis
-                analysis = {
-                    "task_analysis": f"Process user request: {user_message[:100]}",
-                    "complexity": "simple",
-                    "selected_tools": self._create_fallback_tools(user_message),
-                    "execution_plan": "Execute tools in sequence",
-                    "expected_outcome": "Provide results to user",
-                }
-
-            # Update state
-            state["current_task"] = analysis.get("task_analysis", "Processing request")
-            state["selected_tools"] = analysis.get("selected_tools", [])
+            state["selected_tools"] = selected_tools
 
             # Add analysis message
             analysis_message = AIMessage(
@@ -319,29 +611,87 @@ Be strategic and only select tools you are confident will help accomplish the us
                 state["step_count"] += 1
                 return state
 
-            # Execute tools in sequence order
-            tools_to_execute = sorted(
-                state["selected_tools"], key=lambda x: x.get("sequence", 0)
-            )
+            # Execute tools in sequence order; tools that share a sequence
+            # number are independent and run concurrently. The analysis
+            # schema guarantees "sequence", so normalize any stragglers once
+            # and sort with a C-dispatched key
+            for spec in state["selected_tools"]:
+                spec.setdefault("sequence", 0)
+
+            by_sequence = itemgetter("sequence")
+            tools_to_execute = sorted(state["selected_tools"], key=by_sequence)
+            sequence_groups = [
+                list(group)
+                for _, group in groupby(tools_to_execute, key=by_sequence)
+            ]
 
             execution_results = []
             successful_executions = 0
+            stop_execution = False
+
+            # One timestamp per batch is enough for error bookkeeping
+            batch_timestamp = datetime.now().isoformat()
 
-            for i, tool_spec in enumerate(tools_to_execute):
-                tool_name = tool_spec["tool"]
-                parameters = tool_spec["parameters"]
-                is_critical = tool_spec.get("critical", False)
+            # One shared deadline bounds the whole plan instead of letting
+            # each tool consume its own full timeout
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.max_total_tool_seconds
 
+            async def _call_with_deadline(spec):
+                breaker = self._tool_breaker(spec["tool"])
+                if breaker.is_open():
+                    raise CircuitBreakerOpen(
+                        f"Circuit breaker open for tool '{spec['tool']}'"
+                    )
+                try:
+                    async with asyncio.timeout(max(0.0, deadline - loop.time())):
+                        result = await self.mcp_client.call_tool(
+                            spec["tool"], spec["parameters"]
+                        )
+                except Exception:
+                    breaker.record_failure()
+                    raise
+                if result.success:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+                return result
+
+            for group in sequence_groups:
                 logger.info(
-                    f"Executing tool {i+1}/{len(tools_to_execute)}: {tool_name}"
+                    f"Executing {len(group)} tool(s) concurrently: "
+                    f"{[spec['tool'] for spec in group]}"
                 )
 
-                try:
-                    # Execute the tool with timeout
-                    result = await asyncio.wait_for(
-                        self.mcp_client.call_tool(tool_name, parameters),
-                        timeout=120,  # 2 minute timeout per tool
-                    )
+                group_results = await asyncio.gather(
+                    *(_call_with_deadline(spec) for spec in group),
+                    return_exceptions=True,
+                )
+
+                for tool_spec, result in zip(group, group_results):
+                    tool_name = tool_spec["tool"]
+                    parameters = tool_spec["parameters"]
+                    is_critical = tool_spec.get("critical", False)
+
+                    if isinstance(result, asyncio.TimeoutError):
+                        logger.error(f"❌ {tool_name} timed out")
+                        result = self._make_error_result(
+                            tool_name,
+                            parameters,
+                            "Tool execution timed out",
+                            self.max_total_tool_seconds,
+                            batch_timestamp,
+                        )
+                    elif isinstance(result, Exception):
+                        logger.error(f"❌ {tool_name} execution error: {result}")
+                        result = self._make_error_result(
+                            tool_name,
+                            parameters,
+                            str(result),
+                            0.0,
+                            batch_timestamp,
+                        )
+
                     execution_results.append(result)
 
                     if result.success:
@@ -355,51 +705,10 @@ Be strategic and only select tools you are confident will help accomplish the us
                             logger.error(
                                 f"Critical tool {tool_name} failed, stopping execution"
                             )
-                            break
-
-                except asyncio.TimeoutError:
-                    logger.error(f"❌ {tool_name} timed out")
-                    # Create timeout result
-                    timeout_result = MCPToolResult(
-                        tool_name=tool_name,
-                        parameters=parameters,
-                        result={"error": "Tool execution timed out"},
-                        success=False,
-                        execution_time=120.0,
-                        timestamp=datetime.now().isoformat(),
-                        error="Tool execution timed out",
-                    )
-                    execution_results.append(timeout_result)
-
-                    if is_critical:
-                        logger.error(
-                            f"Critical tool {tool_name} timed out, stopping execution"
-                        )
-                        break
-
-                except Exception as e:
-                    logger.error(f"❌ {tool_name} execution error: {e}")
-                    # Create error result
-                    error_result = MCPToolResult(
-                        tool_name=tool_name,
-                        parameters=parameters,
-                        result={"error": str(e)},
-                        success=False,
-                        execution_time=0.0,
-                        timestamp=datetime.now().isoformat(),
-                        error=str(e),
-                    )
-                    execution_results.append(error_result)
-
-                    if is_critical:
-                        logger.error(
-                            f"Critical tool {tool_name} failed, stopping execution"
-                        )
-                        break
+                            stop_execution = True
 
-                # Small delay between tools
-                if i < len(tools_to_execute) - 1:
-                    await asyncio.sleep(0.5)
+                if stop_execution:
+                    break
 
             # Update state with results
             state["tool_results"] = execution_results
@@ -432,60 +741,59 @@ Be strategic and only select tools you are confident will help accomplish the us
         """Generate comprehensive response based on tool results"""
         try:
             original_request = state["messages"][0].content
-            tool_results = state["tool_results"]
+            tool_results = _trim_results(state["tool_results"])
 
             # Check if we have any tool results
             if not tool_results:
                 # Handle case with no tools executed
                 try:
-                    response = await self.llm.ainvoke(
+                    final_response = await self._stream_completion(
                         [
                             SystemMessage(content="You are a helpful AI assistant."),
                             HumanMessage(
-                                content=f"The user asked: '{original_request}'\n\nNo external tools were used. Provide a helpful response based on your knowledge."
+                                content=self._direct_prompt_tmpl.format(
+                                    original_request=original_request
+                                )
                             ),
                         ]
                     )
-                    final_response = response.content
                 except Exception as e:
                     logger.error(f"Direct response generation failed: {e}")
                     final_response = f"I understand you're asking about: {original_request}\n\nI encountered some technical difficulties, but I'm here to help. Could you please rephrase your request or ask something specific I can assist with?"
             else:
+                # Check the semantic cache before paying a Bedrock round trip
+                results_key = hash_tool_results(tool_results)
+                cached_response = self.response_cache.get(
+                    original_request, results_key
+                )
+                if cached_response is not None:
+                    logger.info("Semantic cache hit, skipping Bedrock call")
+                    state["final_response"] = cached_response
+                    state["messages"].append(AIMessage(content=cached_response))
+                    state["step_count"] += 1
+                    return state
+
                 # Format tool results for the prompt
                 results_summary = _format_results_for_prompt(tool_results)
 
-                response_prompt = f"""
-Generate a comprehensive, helpful response to the user based on the tool execution results.
-
-Original User Request: {original_request}
-
-Tool Execution Results:
-{results_summary}
-
-Guidelines for the response:
-1. Directly address the user's original request
-2. Highlight successful operations and key findings
-3. Mention any errors or limitations encountered
-4. Provide actionable information or next steps
-5. Be conversational and user-friendly
-6. Include relevant details from the tool outputs
-7. If files were created, mention their locations
-8. If data was found, summarize key insights
-
-Create a response that feels natural and complete, as if you personally completed the user's request.
-"""
+                response_prompt = self._response_prompt_tmpl.format(
+                    original_request=original_request,
+                    results_summary=results_summary,
+                )
 
                 try:
-                    # Generate response with Bedrock
-                    response = await self.llm.ainvoke(
+                    # Generate response with Bedrock, streamed token by token
+                    final_response = await self._stream_completion(
                         [
                             SystemMessage(
-                                content="You are a helpful AI assistant providing results to a user."
+                                content=_cached_system_blocks(RESPONSE_SYSTEM_PROMPT)
                             ),
                             HumanMessage(content=response_prompt),
                         ]
                     )
-                    final_response = response.content
+                    self.response_cache.set(
+                        original_request, results_key, final_response
+                    )
                 except Exception as e:
                     logger.error(f"Response generation with Bedrock failed: {e}")
                     final_response = self._create_fallback_response(state)
@@ -515,35 +823,45 @@ Create a response that feels natural and complete, as if you personally complete
         """Handle errors and attempt recovery"""
         try:
             original_request = state["messages"][0].content
-            tool_results = state.get("tool_results", [])
+            tool_results = _trim_results(state.get("tool_results", []))
 
-            error_analysis = "I encountered some issues while processing your request, but let me provide what information I can."
+            # Build the summary in a list buffer; repeated str += is
+            # quadratic in the total text size
+            buf = [
+                "I encountered some issues while processing your request, but let me provide what information I can."
+            ]
 
             # Check what tools succeeded and failed
             successful_tools = [r for r in tool_results if r.success]
             failed_tools = [r for r in tool_results if not r.success]
 
             if successful_tools:
-                error_analysis += (
+                buf.append(
                     f"\n\nI successfully completed {len(successful_tools)} operations:"
                 )
                 for result in successful_tools:
                     summary = self._summarize_result(result)
-                    error_analysis += f"\n• {result.tool_name}: {summary}"
+                    buf.append(f"\n• {result.tool_name}: {summary}")
 
             if failed_tools:
-                error_analysis += (
+                buf.append(
                     f"\n\n{len(failed_tools)} operations encountered issues:"
                 )
                 for result in failed_tools:
-                    error_analysis += (
+                    buf.append(
                         f"\n• {result.tool_name}: {result.error or 'Unknown error'}"
                     )
 
             if not tool_results:
-                error_analysis += f"\n\nRegarding your request: '{original_request}'\n\nI can provide general information and guidance based on my knowledge, even though I couldn't use external tools. What specific aspect would you like me to help with?"
+                buf.append(
+                    f"\n\nRegarding your request: '{original_request}'\n\nI can provide general information and guidance based on my knowledge, even though I couldn't use external tools. What specific aspect would you like me to help with?"
+                )
             else:
-                error_analysis += "\n\nPlease let me know if you'd like me to retry any specific operations or if you need help with something else."
+                buf.append(
+                    "\n\nPlease let me know if you'd like me to retry any specific operations or if you need help with something else."
+                )
+
+            error_analysis = "".join(buf)
 
             state["final_response"] = error_analysis
             error_message = AIMessage(content=error_analysis)
@@ -563,6 +881,25 @@ Create a response that feels natural and complete, as if you personally complete
             state["step_count"] += 1
             return state
 
+    def _make_error_result(
+        self,
+        tool_name: str,
+        parameters: Dict[str, Any],
+        error: str,
+        elapsed: float,
+        timestamp: str,
+    ) -> MCPToolResult:
+        """Build a failed MCPToolResult for a timed-out or crashed tool"""
+        return MCPToolResult(
+            tool_name=tool_name,
+            parameters=parameters,
+            result={"error": error},
+            success=False,
+            execution_time=elapsed,
+            timestamp=timestamp,
+            error=error,
+        )
+
     def _should_continue_execution(self, state: AgentState) -> str:
         """Determine next step in workflow"""
         # Check if we've exceeded max steps
@@ -580,19 +917,18 @@ Create a response that feels natural and complete, as if you personally complete
             logger.info("Tools not executed yet, continuing")
             return "continue"
 
-        # Check if there were critical failures
+        # Check if there were critical failures; index the critical flags
+        # once instead of rescanning selected_tools per failed result
         tool_results = state.get("tool_results", [])
-        critical_failures = []
-
-        for result in tool_results:
-            if not result.success:
-                # Check if this was marked as critical in the original tool spec
-                for tool_spec in state.get("selected_tools", []):
-                    if tool_spec["tool"] == result.tool_name and tool_spec.get(
-                        "critical", False
-                    ):
-                        critical_failures.append(result)
-                        break
+        critical_by_name = {
+            tool_spec["tool"]: tool_spec.get("critical", False)
+            for tool_spec in state.get("selected_tools", [])
+        }
+        critical_failures = [
+            result
+            for result in tool_results
+            if not result.success and critical_by_name.get(result.tool_name)
+        ]
 
         if critical_failures:
             logger.info(
@@ -635,6 +971,21 @@ Create a response that feels natural and complete, as if you personally complete
         Returns:
             Dict containing the complete execution results
         """
+        # Trivial requests get a direct response without entering the
+        # workflow at all
+        direct_response = _classify_direct(user_request)
+        if direct_response is not None:
+            return {
+                "success": True,
+                "final_response": direct_response,
+                "messages": [
+                    HumanMessage(content=user_request),
+                    AIMessage(content=direct_response),
+                ],
+                "tool_results": [],
+                "steps_taken": 0,
+            }
+
         try:
             # Set up initial state
             initial_state = {
@@ -642,41 +993,28 @@ Create a response that feels natural and complete, as if you personally complete
                 "current_task": "",
                 "selected_tools": [],
                 "tool_results": [],
-                "context": context
-                or {"session_id": f"session_{int(datetime.now().timestamp())}"},
+                "context": context or {"session_id": self._default_session_id},
                 "step_count": 0,
                 "max_steps": self.max_steps,
                 "final_response": "",
             }
 
-            # Use AsyncSqliteSaver as an async context manager
-            async with AsyncSqliteSaver.from_conn_string(":memory:") as checkpointer:
-                # Compile the workflow with checkpointing
-                app = self.workflow.compile(checkpointer=checkpointer)
+            # Reuse the compiled workflow and its shared checkpointer
+            app = await self._get_app()
 
-                # Execute the workflow
-                config = {
-                    "configurable": {
-                        "thread_id": f"thread_{int(datetime.now().timestamp())}"
-                    }
-                }
-                final_state = initial_state
+            # Execute the workflow
+            config = {
+                "configurable": {"thread_id": f"thread_{uuid.uuid4().hex}"}
+            }
+            final_state = initial_state
 
-                async for chunk in app.astream(initial_state, config):
-                    for node_name, node_output in chunk.items():
-                        logger.info(f"Completed node: {node_name}")
-                        final_state = node_output
+            async for chunk in app.astream(initial_state, config):
+                for node_name, node_output in chunk.items():
+                    logger.info(f"Completed node: {node_name}")
+                    final_state = node_output
 
-            # Clean up MCP connection
-            try:
-                if hasattr(self.mcp_client, "is_connected"):
-                    connected = self.mcp_client.is_connected()
-                    if asyncio.iscoroutine(connected):
-                        connected = await connected
-                    if connected:
-                        await self.mcp_client.disconnect()
-            except Exception as e:
-                logger.warning(f"Error during MCP disconnect: {e}")
+            # The MCP connection stays warm for the next request; call
+            # close() to shut it down explicitly
 
             # Return successful result
             return {
@@ -700,6 +1038,29 @@ Create a response that feels natural and complete, as if you personally complete
                 "steps_taken": 0,
             }
 
+    async def process_request_stream(self, user_request, context=None):
+        """Process a request, yielding response tokens as they arrive
+
+        Wraps process_request and surfaces the Bedrock completion chunks so
+        callers can render output at time-to-first-token instead of waiting
+        for the full response.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._token_callback = queue.put_nowait
+
+        task = asyncio.create_task(self.process_request(user_request, context))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            while True:
+                token = await queue.get()
+                if token is None:
+                    break
+                yield token
+        finally:
+            self._token_callback = None
+            await task
+
 
 async def interactive_mode():
     """Interactive mode for testing the agent"""
@@ -765,6 +1126,8 @@ async def interactive_mode():
         except Exception as e:
             print(f"\nError: {str(e)}")
 
+    await agent.close()
+
 
 async def main():
     """Main function - choose mode"""
@@ -800,6 +1163,14 @@ if __name__ == "__main__":
     # Ensure event loop compatibility
     if os.name == "nt":  # Windows
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        # uvloop trims per-await overhead on POSIX when available
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
 
     print("Starting Bedrock MCP Agent")
     print("Make sure:")
@@ -0,0 +1,89 @@
+"""
+Response caching for the Bedrock MCP agent
+
+"""
+
+import hashlib
+import math
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _embed(text: str) -> Dict[str, float]:
+    """Build a normalized bag-of-words vector for a piece of text"""
+    counts = Counter(_TOKEN_PATTERN.findall(text.lower()))
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    if norm == 0:
+        return {}
+    return {token: count / norm for token, count in counts.items()}
+
+
+def _cosine_similarity(a: Dict[str, float], b: Dict[str, float]) -> float:
+    """Cosine similarity between two normalized token vectors"""
+    if len(b) < len(a):
+        a, b = b, a
+    return sum(weight * b.get(token, 0.0) for token, weight in a.items())
+
+
+def hash_tool_results(tool_results: List[Any]) -> str:
+    """Create a stable hash of tool results for cache keying"""
+    summary = sorted(
+        (result.tool_name, bool(result.success)) for result in tool_results
+    )
+    return hashlib.sha256(repr(summary).encode()).hexdigest()
+
+
+class SemanticResponseCache:
+    """Semantic cache for generated responses keyed by request similarity
+
+    Paraphrased repeats of a request (with the same tool-result shape) can
+    reuse a previously generated response instead of paying another Bedrock
+    round trip.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.85,
+        ttl: float = 3600.0,
+        max_entries: int = 256,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Entries are (embedding, results_key, response, stored_at)
+        self._entries: List[Tuple[Dict[str, float], str, str, float]] = []
+
+    def get(self, request: str, results_key: str) -> Optional[str]:
+        """Return a cached response for a similar request, or None"""
+        now = time.monotonic()
+        self._entries = [e for e in self._entries if now - e[3] < self.ttl]
+
+        query = _embed(request)
+        best_response = None
+        best_similarity = self.similarity_threshold
+
+        for embedding, entry_key, response, _ in self._entries:
+            if entry_key != results_key:
+                continue
+            similarity = _cosine_similarity(query, embedding)
+            if similarity >= best_similarity:
+                best_similarity = similarity
+                best_response = response
+
+        return best_response
+
+    def set(self, request: str, results_key: str, response: str):
+        """Store a generated response for future similar requests"""
+        if len(self._entries) >= self.max_entries:
+            self._entries.pop(0)
+        self._entries.append(
+            (_embed(request), results_key, response, time.monotonic())
+        )
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._entries.clear()
@@ -1,37 +1,127 @@
-import json
+import re
+from dataclasses import replace
 from typing import Dict, Any, List
+
+from pydantic import BaseModel, Field
+
 from client_side.utils.mcp_tools_models import MCPToolResult
+from client_side.utils.utils import _format_tools_for_prompt  # noqa: F401
+
+
+class ToolSpec(BaseModel):
+    """One planned tool call in the analysis response"""
+
+    tool: str
+    parameters: Dict[str, Any] = Field(default_factory=dict)
+    reason: str = ""
+    sequence: int = 1
+    critical: bool = False
+
+
+class Analysis(BaseModel):
+    """Schema of the tool-selection JSON the analysis prompt requests"""
+
+    task_analysis: str = "Task analysis not provided"
+    complexity: str = "simple"
+    selected_tools: List[ToolSpec] = Field(default_factory=list)
+    execution_plan: str = ""
+    expected_outcome: str = ""
+
+
+def _trim_text(text: str, budget: int) -> str:
+    """Keep the head and tail of oversized text with a truncation marker"""
+    if len(text) <= budget:
+        return text
+    head = budget * 2 // 3
+    tail = budget - head
+    omitted = len(text) - head - tail
+    return f"{text[:head]}...[TRUNCATED {omitted} chars]...{text[-tail:]}"
+
+
+def _trim_results(
+    results: List[MCPToolResult], max_chars: int = 12000
+) -> List[MCPToolResult]:
+    """Trim oversized tool outputs before they reach a prompt
+
+    Raw tool output (file reads, API payloads) grows without bound and
+    every character becomes Bedrock input tokens. Each result gets an even
+    share of the character budget, applied head+tail to its text fields.
+    """
+    if not results:
+        return results
+
+    per_result = max(500, max_chars // len(results))
+
+    trimmed = []
+    for result in results:
+        payload = result.result
+        if isinstance(payload, dict):
+            oversized = {
+                key: value
+                for key, value in payload.items()
+                if key in ("content", "output")
+                and isinstance(value, str)
+                and len(value) > per_result
+            }
+            if oversized:
+                payload = {
+                    **payload,
+                    **{
+                        key: _trim_text(value, per_result)
+                        for key, value in oversized.items()
+                    },
+                }
+                result = replace(result, result=payload)
+        trimmed.append(result)
 
+    return trimmed
 
-def _format_tools_for_prompt(tools) -> str:
-    """Format available tools for the analysis prompt"""
-    if not tools:
-        return "No tools available"
 
-    tools_text = ""
-    for tool in tools:
-        tools_text += f"\n**{tool.name}**: {tool.description}\n"
+def _truncstr(value: Any, limit: int) -> str:
+    """Stringify and cap a value without copying already-short strings"""
+    text = value if isinstance(value, str) else str(value)
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "... [truncated]"
 
-        # Add parameter information if available
-        if (
-            hasattr(tool, "input_schema")
-            and tool.input_schema
-            and isinstance(tool.input_schema, dict)
-        ):
-            properties = tool.input_schema.get("properties", {})
-            required = tool.input_schema.get("required", [])
 
-            if properties:
-                tools_text += "  Parameters:\n"
-                for param, schema in properties.items():
-                    is_required = param in required
-                    param_desc = schema.get(
-                        "description", schema.get("type", "parameter")
-                    )
-                    tools_text += f"    - {param} ({'required' if is_required else 'optional'}): {param_desc}\n"
-        tools_text += "\n"
+def _handle_content(value, append):
+    append(f"  Content: {_truncstr(value, 300)}\n")
 
-    return tools_text
+
+def _handle_results(value, append):
+    if isinstance(value, list):
+        append(f"  Found {len(value)} results\n")
+        # Include first few results
+        for i, item in enumerate(value[:3]):
+            if isinstance(item, dict):
+                title = item.get("title", item.get("name", f"Result {i+1}"))
+                append(f"    - {title}\n")
+
+
+def _handle_message(value, append):
+    append(f"  Message: {value}\n")
+
+
+def _handle_output(value, append):
+    append(f"  Output: {_truncstr(value, 200)}\n")
+
+
+def _handle_files(value, append):
+    if isinstance(value, list):
+        append(f"  Found {len(value)} files\n")
+
+
+# Iteration order of the table fixes the order of prompt fragments
+_RESULT_HANDLERS = {
+    "content": _handle_content,
+    "results": _handle_results,
+    "message": _handle_message,
+    "output": _handle_output,
+    "files": _handle_files,
+}
+
+_INTERESTING_KEYS = frozenset(_RESULT_HANDLERS)
 
 
 def _format_results_for_prompt(results: List[MCPToolResult]) -> str:
@@ -39,69 +129,40 @@ def _format_results_for_prompt(results: List[MCPToolResult]) -> str:
     if not results:
         return "No tool results available"
 
-    results_text = ""
+    parts = []
+    append = parts.append
 
     for result in results:
         status = "SUCCESS" if result.success else "FAILED"
-        results_text += (
-            f"\n{status} - {result.tool_name} ({result.execution_time:.2f}s)\n"
-        )
+        append(f"\n{status} - {result.tool_name} ({result.execution_time:.2f}s)\n")
 
-        if result.success and hasattr(result, "result") and result.result:
+        res = result.result if hasattr(result, "result") else None
+        if result.success and res:
             # Handle different result formats
-            if isinstance(result.result, dict):
-                if "content" in result.result:
-                    content = str(result.result["content"])
-                    if len(content) > 300:
-                        content = content[:300] + "... [truncated]"
-                    results_text += f"  Content: {content}\n"
-
-                if "results" in result.result and isinstance(
-                    result.result["results"], list
-                ):
-                    count = len(result.result["results"])
-                    results_text += f"  Found {count} results\n"
-                    # Include first few results
-                    for i, item in enumerate(result.result["results"][:3]):
-                        if isinstance(item, dict):
-                            title = item.get("title", item.get("name", f"Result {i+1}"))
-                            results_text += f"    - {title}\n"
-
-                if "message" in result.result:
-                    results_text += f"  Message: {result.result['message']}\n"
-
-                if "output" in result.result:
-                    output = str(result.result["output"])
-                    if len(output) > 200:
-                        output = output[:200] + "... [truncated]"
-                    results_text += f"  Output: {output}\n"
-
-                if "files" in result.result:
-                    files = result.result["files"]
-                    if isinstance(files, list):
-                        results_text += f"  Found {len(files)} files\n"
+            if isinstance(res, dict):
+                present = _INTERESTING_KEYS & res.keys()
+                for key, handler in _RESULT_HANDLERS.items():
+                    if key in present:
+                        handler(res[key], append)
             else:
-                results_text += f"  Result: {str(result.result)[:200]}\n"
+                append(f"  Result: {str(res)[:200]}\n")
         else:
-            results_text += f"  Error: {result.error or 'Unknown error'}\n"
+            append(f"  Error: {result.error or 'Unknown error'}\n")
+
+    return "".join(parts)
+
 
-    return results_text
+_JSON_BLOCK_RE = re.compile(r"```json\s*(.*?)\s*(?:```|$)", re.IGNORECASE | re.DOTALL)
 
 
 def _parse_json_response(response_text: str) -> Dict[str, Any]:
     """Parse JSON from LLM response with better error handling"""
     try:
-        # Try to find JSON block in the response
-        response_text = response_text.strip()
-
-        # Look for JSON block markers
-        if "```json" in response_text.lower():
-            start_marker = response_text.lower().find("```json") + 7
-            end_marker = response_text.find("```", start_marker)
-            if end_marker > start_marker:
-                json_str = response_text[start_marker:end_marker].strip()
-            else:
-                json_str = response_text[start_marker:].strip()
+        # Look for a fenced JSON block without lowercasing the whole
+        # response just to locate the marker
+        match = _JSON_BLOCK_RE.search(response_text)
+        if match:
+            json_str = match.group(1)
         else:
             # Try to find JSON object boundaries
             start_idx = response_text.find("{")
@@ -110,22 +171,11 @@ def _parse_json_response(response_text: str) -> Dict[str, Any]:
             if start_idx >= 0 and end_idx > start_idx:
                 json_str = response_text[start_idx:end_idx]
             else:
-                json_str = response_text
-
-        # Parse JSON
-        parsed = json.loads(json_str)
-
-        # Validate required fields
-        if not isinstance(parsed, dict):
-            raise ValueError("Response is not a JSON object")
-
-        # Ensure required fields exist
-        if "selected_tools" not in parsed:
-            parsed["selected_tools"] = []
-        if "task_analysis" not in parsed:
-            parsed["task_analysis"] = "Task analysis not provided"
+                json_str = response_text.strip()
 
-        return parsed
+        # Parse and validate against the known analysis schema in one
+        # pass; defaults fill any fields the model left out
+        return Analysis.model_validate_json(json_str).model_dump()
 
     except Exception as e:
         return {
@@ -1,14 +1,26 @@
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import time
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from dataclasses import replace
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
+
+import orjson
 
 # Import MCP client components
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 from utils.mcp_tools_models import MCPTool, MCPToolCall, MCPToolResult
-from utils.utils import _format_parameters_for_tool, _parse_tool_result
+from utils.utils import (
+    _format_parameters_for_tool,
+    _format_tools_for_prompt,
+    _parse_tool_result,
+)
 
 
 logging.basicConfig(
@@ -17,18 +29,62 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Tool names as the servers actually register them: _server.py exposes
+# file_system/database_query/api_client, server.py exposes
+# filesystem_operation/database_query/api_call
+_FILESYSTEM_TOOLS = frozenset({"file_system", "filesystem_operation"})
+_DATABASE_TOOLS = frozenset({"database_query"})
+_API_TOOLS = frozenset({"api_client", "api_call"})
+
+
+def _is_idempotent_call(tool_name: str, parameters: Dict[str, Any]) -> bool:
+    """Whether a tool call is read-only and therefore safe to cache"""
+    if tool_name in _FILESYSTEM_TOOLS:
+        return parameters.get("operation") == "read"
+    if tool_name in _DATABASE_TOOLS:
+        query = parameters.get("query", "")
+        return isinstance(query, str) and query.lstrip()[:6].upper() == "SELECT"
+    if tool_name in _API_TOOLS:
+        return parameters.get("method", "GET").upper() == "GET"
+    return False
+
+
 class MCPClient:
     """Client for interacting with the MCP server"""
 
-    def __init__(self, server_script: str = "server_side\server.py"):
-        self.server_script = server_script
+    def __init__(self, server_script: str = "server_side/server.py"):
+        # Normalize separators once so a Windows-style default cannot turn
+        # into a literal backslashed filename on POSIX, and resolve the
+        # absolute path up front; a missing script fails here instead of
+        # after a 30s connect timeout.
+        script_path = Path(server_script.replace("\\", "/")).expanduser().resolve()
+        if not script_path.is_file():
+            raise FileNotFoundError(f"MCP server script not found: {script_path}")
+        self.server_script = str(script_path)
         self.server_parameters = None
         self.timeout = 30
+        self.max_concurrency = 8
+        self._result_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, MCPToolResult]]" = (
+            OrderedDict()
+        )
+        self._result_cache_max = 128
+        self._result_cache_ttl = 60.0
         self._connected = False
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._session: Optional[ClientSession] = None
         self.available_tools: List[Dict[str, MCPTool]] = []
+        self.tools_prompt: str = ""
 
     async def connect(self):
-        """Connect to the MCP server using stdio"""
+        """Connect to the MCP server and hold one session for the lifetime
+
+        Spawning the STDIO subprocess and running the initialize handshake
+        is the expensive part, so it happens once here instead of on every
+        tool call.
+        """
+        if self._connected and self._session is not None:
+            return True
+
         try:
             self.server_parameters = StdioServerParameters(
                 command="python",
@@ -36,7 +92,18 @@ class MCPClient:
                 env=None,
             )
 
-            await asyncio.wait_for(self.discover_tools(), timeout=self.timeout)
+            self._exit_stack = AsyncExitStack()
+            read, write = await self._exit_stack.enter_async_context(
+                stdio_client(self.server_parameters)
+            )
+            self._session = await self._exit_stack.enter_async_context(
+                ClientSession(read, write)
+            )
+            async with asyncio.timeout(self.timeout):
+                await self._session.initialize()
+
+            async with asyncio.timeout(self.timeout):
+                await self.discover_tools()
             self._connected = True
             logger.info(f"Connected to MCP server {self.server_script} successfully.")
             return True
@@ -44,13 +111,26 @@ class MCPClient:
             logger.error(
                 f"Connection to MCP server timed out after {self.timeout} seconds."
             )
+            await self._close_session()
             return False
         except Exception as e:
             logger.error(f"Failed to connect to MCP server: {e}")
+            await self._close_session()
             return False
 
+    async def _close_session(self):
+        """Tear down the persistent session and its subprocess"""
+        if self._exit_stack is not None:
+            try:
+                await self._exit_stack.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing MCP session: {e}")
+            self._exit_stack = None
+            self._session = None
+
     async def disconnect(self):
         """Disconnect from the MCP server"""
+        await self._close_session()
         self._connected = False
         logger.info("Disconnected from MCP server.")
 
@@ -61,30 +141,26 @@ class MCPClient:
     async def discover_tools(self):
         """Discover available tools from the MCP server"""
         try:
-            if not self.server_parameters:
-                self.server_parameters = StdioServerParameters(
-                    command="python",
-                    args=[self.server_script],
-                    env=None,
+            if self._session is None:
+                if not await self.connect():
+                    return []
+
+            tools_response = await self._session.list_tools()
+
+            tools = getattr(tools_response, "tools", None) or ()
+            _MT = MCPTool
+            self.available_tools = {
+                tool.name: _MT(
+                    name=tool.name,
+                    description=tool.description or "No description available",
+                    input_schema=tool.inputSchema or {},
                 )
-
-            async with stdio_client(self.server_parameters) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    tools_response = await session.list_tools()
-
-                    self.available_tools = {}
-
-                    if hasattr(tools_response, "tools") and tools_response.tools:
-                        for tool in tools_response.tools:
-                            self.available_tools[tool.name] = MCPTool(
-                                name=tool.name,
-                                description=tool.description
-                                or "No description available",
-                                input_schema=(
-                                    tool.inputSchema if tool.inputSchema else {}
-                                ),
-                            )
+                for tool in tools
+            }
+            # Paid once per (re)connect so agent turns read an attribute
+            self.tools_prompt = _format_tools_for_prompt(
+                list(self.available_tools.values())
+            )
             logger.info(
                 f"Discovered tools from MCP server: {len(self.available_tools)} tools available."
             )
@@ -100,6 +176,10 @@ class MCPClient:
             await self.discover_tools()
         return list(self.available_tools.values())
 
+    def get_tools_prompt(self) -> str:
+        """Formatted tool-catalog prompt, precomputed at discovery time"""
+        return self.tools_prompt
+
     def get_tool_info(self, tool_name: str) -> Optional[MCPTool]:
         """Get information about a specific tool"""
         return self.available_tools.get(tool_name)
@@ -107,11 +187,16 @@ class MCPClient:
     async def call_tool(
         self, tool_name: str, parameters: Dict[str, Any]
     ) -> MCPToolResult:
-        """Execute a tool call on MCP Server with the given parameters"""
-        start_time = datetime.now()
+        """Execute a tool call on MCP Server with the given parameters
+
+        Read-only calls (file reads, SELECTs, GETs) are served from a
+        small TTL'd LRU cache, since agents routinely repeat the same
+        call across iterations.
+        """
+        start_time = time.perf_counter()
 
         try:
-            if not self._connected or not self.server_parameters:
+            if not self._connected or self._session is None:
                 raise RuntimeError("Client is not connected to the MCP server.")
             if tool_name not in self.available_tools:
                 raise ValueError(
@@ -120,36 +205,59 @@ class MCPClient:
 
             formattted_parameters = _format_parameters_for_tool(tool_name, parameters)
 
-            async with stdio_client(self.server_parameters) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
+            cache_key = None
+            if _is_idempotent_call(tool_name, formattted_parameters):
+                cache_key = (
+                    tool_name,
+                    orjson.dumps(
+                        formattted_parameters, option=orjson.OPT_SORT_KEYS
+                    ),
+                )
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    stored_at, cached_result = cached
+                    if time.monotonic() - stored_at < self._result_cache_ttl:
+                        self._result_cache.move_to_end(cache_key)
+                        logger.debug(f"Result cache hit for '{tool_name}'")
+                        return replace(
+                            cached_result,
+                            timestamp=datetime.now().isoformat(),
+                        )
+                    del self._result_cache[cache_key]
+
+            async with asyncio.timeout(self.timeout):
+                result = await self._session.call_tool(
+                    tool_name, formattted_parameters
+                )
+            execution_time = time.perf_counter() - start_time
 
-                    result = await asyncio.wait_for(
-                        session.call_tool(tool_name, formattted_parameters),
-                        timeout=self.timeout,
-                    )
-                    execution_time = (datetime.now() - start_time).total_seconds()
+            result_data = _parse_tool_result(result)
 
-                    result_data = _parse_tool_result(result)
+            success = True
+            error = None
 
-                    success = True
-                    error = None
+            if isinstance(result_data, dict):
+                success = result_data.get(
+                    "success", not bool(result_data.get("error"))
+                )
+                error = result_data.get("error")
 
-                    if isinstance(result_data, dict):
-                        success = result_data.get(
-                            "success", not bool(result_data.get("error"))
-                        )
-                        error = result_data.get("error")
-
-                    return MCPToolResult(
-                        tool_name=tool_name,
-                        parameters=parameters,
-                        result=result_data,
-                        success=success,
-                        execution_time=execution_time,
-                        timestamp=datetime.now().isoformat(),
-                        error=error,
-                    )
+            tool_result = MCPToolResult(
+                tool_name=tool_name,
+                parameters=parameters,
+                result=result_data,
+                success=success,
+                execution_time=execution_time,
+                timestamp=datetime.now().isoformat(),
+                error=error,
+            )
+
+            if cache_key is not None and success:
+                self._result_cache[cache_key] = (time.monotonic(), tool_result)
+                if len(self._result_cache) > self._result_cache_max:
+                    self._result_cache.popitem(last=False)
+
+            return tool_result
         except Exception as e:
             logger.error(f"Tool call failed for '{tool_name}': {e}")
             return MCPToolResult(
@@ -157,7 +265,7 @@ class MCPClient:
                 parameters=parameters,
                 result=None,
                 success=False,
-                execution_time=(datetime.now() - start_time).total_seconds(),
+                execution_time=time.perf_counter() - start_time,
                 timestamp=datetime.now().isoformat(),
                 error=str(e),
             )
@@ -165,23 +273,115 @@ class MCPClient:
     async def call_multiple_tools(
         self, tool_calls: List[MCPToolCall]
     ) -> List[MCPToolResult]:
-        """Execute multiple tool calls in sequence"""
-        results = []
+        """Execute multiple tool calls concurrently
 
-        for tool_call in tool_calls:
-            result = await self.call_tool(tool_call.tool_name, tool_call.parameters)
-            results.append(result)
+        Calls are independent, so they dispatch together over the
+        persistent session; a semaphore bounds how many run at once.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            # Log progress
-            status = "✅" if result.success else "❌"
-            logger.info(f"{status} {tool_call.tool_name}: {result.execution_time:.2f}s")
+        async def _bounded_call(tool_call: MCPToolCall) -> MCPToolResult:
+            async with semaphore:
+                return await self.call_tool(
+                    tool_call.tool_name, tool_call.parameters
+                )
 
-            # Small delay between calls
-            await asyncio.sleep(0.1)
+        results = await asyncio.gather(
+            *(_bounded_call(tool_call) for tool_call in tool_calls)
+        )
+
+        for result in results:
+            status = "✅" if result.success else "❌"
+            logger.info(f"{status} {result.tool_name}: {result.execution_time:.2f}s")
 
         return results
 
 
+class MCPClientPool:
+    """Shares one MCPClient (and its STDIO subprocess) per server script
+
+    Spawning the STDIO server is the expensive part of client setup, so
+    multiple agents pointed at the same script reuse a single client. The
+    pool refcounts acquisitions; fully released clients stay warm for
+    ``idle_timeout`` seconds so a quick re-acquire skips the respawn, and
+    a background reaper disconnects the ones nobody came back for.
+    """
+
+    idle_timeout = 60.0
+    _reap_interval = 15.0
+
+    _clients: Dict[str, "MCPClient"] = {}
+    _refcounts: Dict[str, int] = {}
+    _idle_since: Dict[str, float] = {}
+    _lock = asyncio.Lock()
+    _reaper_task: Optional["asyncio.Task"] = None
+
+    @classmethod
+    async def acquire(cls, server_script: str) -> "MCPClient":
+        """Get the shared client for a server script, creating it if needed"""
+        async with cls._lock:
+            client = cls._clients.get(server_script)
+            if client is None:
+                client = MCPClient(server_script=server_script)
+                cls._clients[server_script] = client
+                cls._refcounts[server_script] = 0
+            cls._refcounts[server_script] += 1
+            cls._idle_since.pop(server_script, None)
+            return client
+
+    @classmethod
+    async def release(cls, server_script: str):
+        """Release a shared client; idle clients are reaped after a grace period"""
+        async with cls._lock:
+            if server_script not in cls._clients:
+                return
+            cls._refcounts[server_script] -= 1
+            if cls._refcounts[server_script] <= 0:
+                cls._idle_since[server_script] = time.monotonic()
+                cls._ensure_reaper()
+
+    @classmethod
+    def _ensure_reaper(cls):
+        """Start the idle-eviction task if it is not already running"""
+        if cls._reaper_task is None or cls._reaper_task.done():
+            cls._reaper_task = asyncio.get_running_loop().create_task(cls._reap())
+
+    @classmethod
+    async def _reap(cls):
+        """Disconnect clients that stayed idle past the keepalive window"""
+        while True:
+            await asyncio.sleep(cls._reap_interval)
+            async with cls._lock:
+                now = time.monotonic()
+                expired = [
+                    script
+                    for script, idle_at in cls._idle_since.items()
+                    if now - idle_at >= cls.idle_timeout
+                ]
+                for script in expired:
+                    client = cls._clients.pop(script, None)
+                    cls._refcounts.pop(script, None)
+                    cls._idle_since.pop(script, None)
+                    if client is not None and client.is_connected():
+                        await client.disconnect()
+                if not cls._idle_since:
+                    return
+
+    @classmethod
+    async def shutdown(cls):
+        """Disconnect every pooled client immediately"""
+        async with cls._lock:
+            if cls._reaper_task is not None:
+                cls._reaper_task.cancel()
+                cls._reaper_task = None
+            for script, client in list(cls._clients.items()):
+                if client.is_connected():
+                    await client.disconnect()
+            cls._clients.clear()
+            cls._refcounts.clear()
+            cls._idle_since.clear()
+
+
 async def demo_client():
     print("Starting MCP Client demo...")
     print("=" * 50)
@@ -202,4 +402,13 @@ async def demo_client():
 
 
 if __name__ == "__main__":
+    if os.name != "nt":
+        # uvloop trims per-await overhead on POSIX when available
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
     asyncio.run(demo_client())
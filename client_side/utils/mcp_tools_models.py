@@ -20,7 +20,7 @@ class MCPToolCall:
     call_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPToolResult:
     """Represents the result of a tool execution"""
 
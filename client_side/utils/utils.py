@@ -1,40 +1,130 @@
+import functools
 from typing import Dict, Any
-import json
+
+import orjson
+
+def _freeze(value):
+    """Recursively convert dicts and lists into hashable tuples"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _format_tools_for_prompt(tools) -> str:
+    """Format available tools for the analysis prompt
+
+    The tool catalog rarely changes between turns, so the formatted text is
+    memoized on a frozen (name, description, schema) signature.
+    """
+    if not tools:
+        return "No tools available"
+
+    signature = tuple(
+        (
+            tool.name,
+            tool.description,
+            _freeze(
+                tool.input_schema
+                if hasattr(tool, "input_schema")
+                and isinstance(tool.input_schema, dict)
+                else {}
+            ),
+        )
+        for tool in tools
+    )
+    return _format_tools_cached(signature)
+
+
+@functools.lru_cache(maxsize=32)
+def _format_tools_cached(signature) -> str:
+    """Build the tools prompt fragment for a frozen tool signature"""
+    parts = []
+    append = parts.append
+
+    for name, description, schema in signature:
+        append(f"\n**{name}**: {description}\n")
+
+        # Add parameter information if available
+        schema_dict = dict(schema)
+        properties = dict(schema_dict.get("properties", ()))
+        required = schema_dict.get("required", ())
+
+        if properties:
+            append("  Parameters:\n")
+            for param, param_schema in properties.items():
+                param_schema = dict(param_schema)
+                is_required = param in required
+                param_desc = param_schema.get(
+                    "description", param_schema.get("type", "parameter")
+                )
+                append(
+                    f"    - {param} ({'required' if is_required else 'optional'}): {param_desc}\n"
+                )
+        append("\n")
+
+    return "".join(parts)
+
+
+# Payloads above this size bypass the parse cache to bound its memory
+_PARSE_CACHE_MAX_TEXT = 64_000
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_loads(text: str):
+    """Parse JSON text, memoizing repeated identical payloads
+
+    Tools frequently return byte-identical output across agent iterations
+    (same file read, same query); the LRU keeps those parses free.
+    """
+    return orjson.loads(text)
+
+
+# Expected parameters per tool: (key, default) pairs. Keys whose value
+# resolves to None are dropped from the formatted call. Keyed by the
+# names the servers register (_server.py: file_system/database_query/
+# api_client; server.py: filesystem_operation/database_query/api_call)
+_FILESYSTEM_PARAM_SPEC = (
+    ("operation", None),
+    ("path", None),
+    ("content", None),
+)
+_DATABASE_PARAM_SPEC = (
+    ("query", None),
+    ("database", "main"),
+)
+_API_PARAM_SPEC = (
+    ("url", None),
+    ("method", "GET"),
+    ("headers", None),
+    ("data", None),
+)
+_TOOL_PARAM_SPECS = {
+    "file_system": _FILESYSTEM_PARAM_SPEC,
+    "filesystem_operation": _FILESYSTEM_PARAM_SPEC,
+    "database_query": _DATABASE_PARAM_SPEC,
+    "api_client": _API_PARAM_SPEC,
+    "api_call": _API_PARAM_SPEC,
+}
 
 
 def _format_parameters_for_tool(
     tool_name: str, parameters: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Format parameters correctly for each tool type"""
+    spec = _TOOL_PARAM_SPECS.get(tool_name)
+    if spec is None:
+        # Fallback to original parameters
+        return parameters
 
-    # Map of tool names to their expected parameter structure
-    tool_param_mapping = {
-        "filesystem": {
-            "operation": parameters.get("operation"),
-            "path": parameters.get("path"),
-            "content": parameters.get("content"),
-        },
-        "database": {
-            "query": parameters.get("query"),
-            "database": parameters.get("database", "main"),
-        },
-        "api_client": {
-            "url": parameters.get("url"),
-            "method": parameters.get("method", "GET"),
-            "headers": parameters.get("headers"),
-            "data": parameters.get("data"),
-        },
-    }
-
-    if tool_name in tool_param_mapping:
-        # Remove None values
-        formatted = {
-            k: v for k, v in tool_param_mapping[tool_name].items() if v is not None
-        }
-        return formatted
-
-    # Fallback to original parameters
-    return parameters
+    get = parameters.get
+    formatted = {}
+    for key, default in spec:
+        value = get(key, default)
+        if value is not None:
+            formatted[key] = value
+    return formatted
 
 
 def _parse_tool_result(result) -> Dict[str, Any]:
@@ -52,8 +142,11 @@ def _parse_tool_result(result) -> Dict[str, Any]:
                     # Try to parse as JSON
                     if text.strip().startswith(("{", "[")):
                         try:
-                            parsed_content.append(json.loads(text))
-                        except json.JSONDecodeError:
+                            if len(text) < _PARSE_CACHE_MAX_TEXT:
+                                parsed_content.append(_cached_loads(text))
+                            else:
+                                parsed_content.append(orjson.loads(text))
+                        except orjson.JSONDecodeError:
                             parsed_content.append({"output": text})
                     else:
                         parsed_content.append({"output": text})
@@ -2,8 +2,9 @@
 Configuration management for MCP Test Environment
 """
 
+import functools
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -81,82 +82,91 @@ class MCPConfig:
     """Main MCP configuration"""
 
     environment: str = "development"
-    database: DatabaseConfig = DatabaseConfig()
-    server: ServerConfig = ServerConfig()
-    agent: AgentConfig = AgentConfig()
-    client: ClientConfig = ClientConfig()
-    test: TestConfig = TestConfig()
-    logging: LoggingConfig = LoggingConfig()
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    server: ServerConfig = field(default_factory=ServerConfig)
+    agent: AgentConfig = field(default_factory=AgentConfig)
+    client: ClientConfig = field(default_factory=ClientConfig)
+    test: TestConfig = field(default_factory=TestConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
 
 
+_TRUE = {"true", "1", "yes"}
+
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> MCPConfig:
-    """Load configuration from environment variables and defaults"""
+    """Load configuration from environment variables and defaults
+
+    The result is memoized: the environment is read once per process and
+    every importer shares the same MCPConfig instance.
+    """
+    env = os.environ
 
     # Environment
-    env = os.getenv("MCP_ENVIRONMENT", "development")
+    environment = env.get("MCP_ENVIRONMENT", "development")
 
     # Database config
     db_config = DatabaseConfig(
-        host=os.getenv("DB_HOST", "localhost"),
-        port=int(os.getenv("DB_PORT", "5432")),
-        name=os.getenv("DB_NAME", "mcp_test"),
-        user=os.getenv("DB_USER", "mcp_user"),
-        password=os.getenv("DB_PASSWORD", "mcp_pass"),
-        sqlite_path=os.getenv("SQLITE_PATH", "./data/sample.db"),
+        host=env.get("DB_HOST", "localhost"),
+        port=int(env.get("DB_PORT", "5432")),
+        name=env.get("DB_NAME", "mcp_test"),
+        user=env.get("DB_USER", "mcp_user"),
+        password=env.get("DB_PASSWORD", "mcp_pass"),
+        sqlite_path=env.get("SQLITE_PATH", "./data/sample.db"),
     )
 
     # Server config
     server_config = ServerConfig(
-        host=os.getenv("SERVER_HOST", "localhost"),
-        port=int(os.getenv("SERVER_PORT", "8000")),
-        debug=os.getenv("SERVER_DEBUG", "true").lower() == "true",
-        workers=int(os.getenv("SERVER_WORKERS", "1")),
-        timeout=int(os.getenv("SERVER_TIMEOUT", "30")),
-        max_connections=int(os.getenv("SERVER_MAX_CONNECTIONS", "100")),
+        host=env.get("SERVER_HOST", "localhost"),
+        port=int(env.get("SERVER_PORT", "8000")),
+        debug=env.get("SERVER_DEBUG", "true").lower() in _TRUE,
+        workers=int(env.get("SERVER_WORKERS", "1")),
+        timeout=int(env.get("SERVER_TIMEOUT", "30")),
+        max_connections=int(env.get("SERVER_MAX_CONNECTIONS", "100")),
     )
 
     # Agent config
     agent_config = AgentConfig(
-        max_iterations=int(os.getenv("AGENT_MAX_ITERATIONS", "10")),
-        timeout=int(os.getenv("AGENT_TIMEOUT", "60")),
-        retry_attempts=int(os.getenv("AGENT_RETRY_ATTEMPTS", "3")),
-        retry_delay=float(os.getenv("AGENT_RETRY_DELAY", "1.0")),
-        bedrock_model=os.getenv(
+        max_iterations=int(env.get("AGENT_MAX_ITERATIONS", "10")),
+        timeout=int(env.get("AGENT_TIMEOUT", "60")),
+        retry_attempts=int(env.get("AGENT_RETRY_ATTEMPTS", "3")),
+        retry_delay=float(env.get("AGENT_RETRY_DELAY", "1.0")),
+        bedrock_model=env.get(
             "BEDROCK_MODEL", "anthropic.claude-3-haiku-20240307-v1:0"
         ),
-        bedrock_region=os.getenv("BEDROCK_REGION", "us-east-1"),
+        bedrock_region=env.get("BEDROCK_REGION", "us-east-1"),
     )
 
     # Client config
     client_config = ClientConfig(
-        server_url=os.getenv("CLIENT_SERVER_URL", "http://localhost:8000"),
-        timeout=int(os.getenv("CLIENT_TIMEOUT", "30")),
-        max_retries=int(os.getenv("CLIENT_MAX_RETRIES", "3")),
-        gradio_port=int(os.getenv("GRADIO_PORT", "7860")),
+        server_url=env.get("CLIENT_SERVER_URL", "http://localhost:8000"),
+        timeout=int(env.get("CLIENT_TIMEOUT", "30")),
+        max_retries=int(env.get("CLIENT_MAX_RETRIES", "3")),
+        gradio_port=int(env.get("GRADIO_PORT", "7860")),
     )
 
     # Test config
     test_config = TestConfig(
-        test_data_path=os.getenv("TEST_DATA_PATH", "./tests/data"),
-        mock_responses=os.getenv("MOCK_RESPONSES", "false").lower() == "true",
-        parallel_tests=os.getenv("PARALLEL_TESTS", "true").lower() == "true",
-        test_timeout=int(os.getenv("TEST_TIMEOUT", "300")),
-        performance_tests=os.getenv("PERFORMANCE_TESTS", "false").lower() == "true",
+        test_data_path=env.get("TEST_DATA_PATH", "./tests/data"),
+        mock_responses=env.get("MOCK_RESPONSES", "false").lower() in _TRUE,
+        parallel_tests=env.get("PARALLEL_TESTS", "true").lower() in _TRUE,
+        test_timeout=int(env.get("TEST_TIMEOUT", "300")),
+        performance_tests=env.get("PERFORMANCE_TESTS", "false").lower() in _TRUE,
     )
 
     # Logging config
     logging_config = LoggingConfig(
-        level=os.getenv("LOG_LEVEL", "INFO"),
-        format=os.getenv(
+        level=env.get("LOG_LEVEL", "INFO"),
+        format=env.get(
             "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         ),
-        file_path=os.getenv("LOG_FILE_PATH"),
-        max_file_size=int(os.getenv("LOG_MAX_FILE_SIZE", str(10 * 1024 * 1024))),
-        backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+        file_path=env.get("LOG_FILE_PATH"),
+        max_file_size=int(env.get("LOG_MAX_FILE_SIZE", str(10 * 1024 * 1024))),
+        backup_count=int(env.get("LOG_BACKUP_COUNT", "5")),
     )
 
     return MCPConfig(
-        environment=env,
+        environment=environment,
         database=db_config,
         server=server_config,
         agent=agent_config,
@@ -1,6 +1,6 @@
 import logging
 import sqlite3
-import json
+import orjson
 
 from typing import Optional
 from pathlib import Path
@@ -48,11 +48,20 @@ class MCPServer:
         db_path = self.data_path / "sample.db"
 
         try:
-            with sqlite3.connect(str(db_path)) as conn:
-                cursor = conn.cursor()
+            conn = sqlite3.connect(str(db_path))
+            try:
+                # WAL with relaxed syncs keeps cold-start fsyncs to a
+                # minimum while staying crash-safe for sample data
+                conn.executescript(
+                    """
+                    PRAGMA journal_mode=WAL;
+                    PRAGMA synchronous=NORMAL;
+                    PRAGMA temp_store=MEMORY;
+                """
+                )
 
-                # Create sample tables
-                cursor.execute(
+                # Create sample tables in one batch
+                conn.executescript(
                     """
                     CREATE TABLE IF NOT EXISTS projects (
                         id INTEGER PRIMARY KEY,
@@ -60,12 +69,8 @@ class MCPServer:
                         description TEXT,
                         status TEXT,
                         created_date TEXT
-                    )
-                """
-                )
+                    );
 
-                cursor.execute(
-                    """
                     CREATE TABLE IF NOT EXISTS research_data (
                         id INTEGER PRIMARY KEY,
                         topic TEXT NOT NULL,
@@ -73,10 +78,12 @@ class MCPServer:
                         source TEXT,
                         relevance_score REAL,
                         created_date TEXT
-                    )
+                    );
                 """
                 )
 
+                cursor = conn.cursor()
+
                 # Insert sample data if tables are empty
                 cursor.execute("SELECT COUNT(*) FROM projects")
                 if cursor.fetchone()[0] == 0:
@@ -141,7 +148,10 @@ class MCPServer:
                         sample_research,
                     )
 
+                # Single transaction commits both seed batches at once
                 conn.commit()
+            finally:
+                conn.close()
 
             logger.info(f"Sample database initialized at {db_path}")
 
@@ -150,71 +160,82 @@ class MCPServer:
 
     def _register_tools(self):
         """Register all MCP tools"""
+        self.app.tool(file_system)
+        self.app.tool(database_query)
+        self.app.tool(api_client)
+
+
+# Tool bodies live at module scope so they are allocated once rather than
+# per server instance. FastMCP derives the input schema from the
+# signature, so helper bindings stay as module references instead of
+# injected default args.
+async def file_system(
+    operation: str, path: str, content: Optional[str] = None
+) -> str:
+    """
+    File system operations with security controls
+
+    Args:
+      - operation: operation_type (read, write, list, delete)
+      - path: file path or directory
+    """
 
-        @self.app.tool
-        async def file_system(
-            operation: str, path: str, content: Optional[str] = None
-        ) -> str:
-            """
-            File system operations with security controls
+    try:
+        # The arguments already passed FastMCP's schema validation, so
+        # skip pydantic's second validation pass
+        input_data = FileOperationInput.model_construct(
+            operation=operation, path=path, content=content
+        )
+        result = _filesystem_operation(input_data)
+        return orjson.dumps(result).decode()
+    except Exception as e:
+        logger.error(f"File system operation failed: {e}")
+        return orjson.dumps({"error": str(e)}).decode()
 
-            Args:
-              - operation: operation_type (read, write, list, delete)
-              - path: file path or directory
-            """
 
-            try:
-                input_data = FileOperationInput(
-                    operation=operation, path=path, content=content
-                )
-                result = _filesystem_operation(input_data)
-                return json.dumps(result)
-            except Exception as e:
-                logger.error(f"File system operation failed: {e}")
-                return json.dumps({"error": str(e)})
-
-        @self.app.tool
-        async def database_query(query: str, database: str = "main") -> str:
-            """
-            Execute SQL queries on the sample database
-
-            Args:
-                - query: SQL query to execute
-                - database: Database name (default: main)
-            """
-            try:
-                input_data = DatabaseQueryInput(query=query, database=database)
-                result = await _execute_database_query(input_data)
-                return json.dumps(result)
-            except Exception as e:
-                logger.error(f"Database query failed: {e}")
-                return json.dumps({"error": str(e)})
-
-        @self.app.tool
-        async def api_client(
-            url: str,
-            method: str = "GET",
-            headers: Optional[Dict[str, str]] = None,
-            data: Optional[Dict[str, Any]] = None,
-        ) -> str:
-            """
-            HTTP API client for external service integration
-
-            Args:
-                url: API endpoint URL
-                method: HTTP method
-                headers: Request headers
-                data: Request data
-            """
-            try:
-                input_data = APICallInput(
-                    url=url, method=method, headers=headers, data=data
-                )
-                result = await _api_call(input_data)
-                return json.dumps(result)
-            except Exception as e:
-                logger.error(f"API client tool error: {e}")
-                return json.dumps({"error": str(e), "success": False})
+async def database_query(query: str, database: str = "main") -> str:
+    """
+    Execute SQL queries on the sample database
+
+    Args:
+        - query: SQL query to execute
+        - database: Database name (default: main)
+    """
+    try:
+        input_data = DatabaseQueryInput.model_construct(
+            query=query, database=database
+        )
+        result = await _execute_database_query(input_data)
+        return orjson.dumps(result).decode()
+    except Exception as e:
+        logger.error(f"Database query failed: {e}")
+        return orjson.dumps({"error": str(e)}).decode()
+
+
+async def api_client(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    HTTP API client for external service integration
+
+    Args:
+        url: API endpoint URL
+        method: HTTP method
+        headers: Request headers
+        data: Request data
+    """
+    try:
+        input_data = APICallInput.model_construct(
+            url=url, method=method, headers=headers, data=data
+        )
+        result = await _api_call(input_data)
+        return orjson.dumps(result).decode()
+    except Exception as e:
+        logger.error(f"API client tool error: {e}")
+        return orjson.dumps({"error": str(e), "success": False}).decode()
 
 
 def main():
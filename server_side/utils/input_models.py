@@ -3,7 +3,7 @@ Input Models For MCP Tools
 
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -11,11 +11,24 @@ class FileOperationInput(BaseModel):
     operation: str = Field(..., description="Operation: read, write, list, delete")
     path: str = Field(..., description="File or directory path")
     content: Optional[str] = Field(None, description="Content for write operations")
+    columnar: bool = Field(
+        False,
+        description="Return list results as parallel columns instead of per-file dicts",
+    )
+    recursive: bool = Field(
+        False, description="Delete directories recursively instead of requiring empty"
+    )
 
 
 class DatabaseQueryInput(BaseModel):
     query: str = Field(..., description="SQL query to execute")
     database: str = Field("main", description="Database name")
+    params: Optional[List[List[Any]]] = Field(
+        None, description="Parameter rows for a bulk executemany insert"
+    )
+    params_batch_size: int = Field(
+        10000, description="Rows per executemany chunk for bulk inserts"
+    )
 
 
 class APICallInput(BaseModel):
@@ -3,14 +3,99 @@ Functions that used in actual tool implementations
 
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import asyncio
+import atexit
+import functools
+import os
+import shutil
+import stat
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import aiohttp
+import orjson
+import re
 from datetime import datetime
 from .input_models import FileOperationInput, APICallInput, DatabaseQueryInput
 from pathlib import Path
 import sqlite3
 
+# Largest file the read operation will load into memory
+_MAX_READ_BYTES = 10 * 1024 * 1024
+
+
+def _apply_sqlite_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply per-connection performance PRAGMAs
+
+    WAL with synchronous=NORMAL drops the rollback-journal fsync and lets
+    readers run during writes; the rest keep temp data and the page cache
+    in memory and make lock contention wait instead of erroring.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA busy_timeout=30000")
+
+
+# Warm SQLite connections per database path so repeated queries keep the
+# page cache instead of paying connect/teardown on every tool call
+_CONN_POOL: Dict[str, "queue.Queue[sqlite3.Connection]"] = {}
+_CONN_POOL_LOCK = threading.Lock()
+_CONN_POOL_MAX = 8
+
+
+def _is_select(query: str) -> bool:
+    """Cheap SELECT check: strip leading whitespace, compare six chars"""
+    return query.lstrip()[:6].lower() == "select"
+
+
+def _get_pooled_connection(db_path: str) -> sqlite3.Connection:
+    """Fetch a warm connection for a database, creating one on miss"""
+    with _CONN_POOL_LOCK:
+        pool = _CONN_POOL.get(db_path)
+        if pool is None:
+            pool = _CONN_POOL[db_path] = queue.Queue(maxsize=_CONN_POOL_MAX)
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        # A larger statement cache keeps compiled plans for the canned
+        # queries agents repeat across iterations
+        conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=512
+        )
+        _apply_sqlite_pragmas(conn)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def _release_pooled_connection(db_path: str, conn: sqlite3.Connection) -> None:
+    """Return a connection to its pool; close it if the pool is full"""
+    try:
+        _CONN_POOL[db_path].put_nowait(conn)
+    except (KeyError, queue.Full):
+        conn.close()
+
+
+@atexit.register
+def _close_pooled_connections() -> None:
+    """Drain and close every pooled connection at interpreter exit"""
+    with _CONN_POOL_LOCK:
+        for pool in _CONN_POOL.values():
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+        _CONN_POOL.clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_data_path(data_path: str) -> Path:
+    """Resolve a data directory once and reuse it across operations"""
+    return Path(data_path).resolve()
+
 
 def _filesystem_read_operation(
     input_data: FileOperationInput, full_path: Path
@@ -26,10 +111,21 @@ def _filesystem_read_operation(
     if input_data.operation == "read":
         if full_path.is_file():
             try:
-                content = full_path.read_text(encoding="utf-8")
+                # Check the size before reading so a pathological file
+                # cannot balloon server memory
+                st = full_path.stat()
+                if st.st_size > _MAX_READ_BYTES:
+                    return {
+                        "error": (
+                            f"File too large to read: {st.st_size} bytes "
+                            f"(limit {_MAX_READ_BYTES})."
+                        ),
+                        "sucess": False,
+                    }
+                content = full_path.read_bytes().decode("utf-8")
                 return {
                     "content": content,
-                    "size": len(content),
+                    "size": st.st_size,
                     "path": str(full_path),
                     "sucess": True,
                 }
@@ -57,37 +153,84 @@ def _filesystem_write_operation(
         }
 
     full_path.parent.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
-    full_path.write_text(input_data.content, encoding="utf-8")
+
+    # Encode once and hand the buffer straight to the kernel; skips the
+    # text-io layer's wrapper objects and intermediate copies
+    payload = input_data.content.encode("utf-8")
+    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
     return {
         "message": "File written successfully.",
-        "size": len(input_data.content),
+        "size": len(payload),
         "path": str(full_path),
         "sucess": True,
     }
 
 
-def _filesystem_list_operation(full_path: Path) -> Dict[str, Any]:
+def _filesystem_list_operation(
+    full_path: Path, columnar: bool = False
+) -> Dict[str, Any]:
     """
     Perform file listing operation with security controls.
     Args:
-        - input_data: FileOperationInput containing directory path
-        - full_path: Base directory for file operations
+        - full_path: Directory to list
+        - columnar: Return parallel columns instead of per-file dicts;
+          lists of primitives are far cheaper to build and serialize for
+          big directories
     Returns:
         - dict: Result of the list operation
     """
-    if full_path.is_dir():
-        files = []
-        for f in full_path.iterdir():
-            files.append(
+    if not full_path.is_dir():
+        return {"error": "Path is not a directory.", "sucess": False}
+
+    fromtimestamp = datetime.fromtimestamp
+
+    if columnar:
+        names = []
+        types = []
+        sizes = []
+        mtimes = []
+        # scandir caches type and stat info from the directory read, so
+        # each entry costs one stat instead of four
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                st = entry.stat()
+                is_dir = entry.is_dir(follow_symlinks=False)
+                names.append(entry.name)
+                types.append("directory" if is_dir else "file")
+                sizes.append(st.st_size if not is_dir else None)
+                mtimes.append(fromtimestamp(st.st_mtime).isoformat())
+        return {
+            "names": names,
+            "types": types,
+            "sizes": sizes,
+            "mtimes": mtimes,
+            "count": len(names),
+            "sucess": True,
+        }
+
+    files = []
+    append = files.append
+    with os.scandir(full_path) as entries:
+        for entry in entries:
+            st = entry.stat()
+            is_dir = entry.is_dir(follow_symlinks=False)
+            append(
                 {
-                    "name": f.name,
-                    "type": "directory" if f.is_dir() else "file",
-                    "size": f.stat().st_size if f.is_file() else None,
-                    "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat(),
+                    "name": entry.name,
+                    "type": "directory" if is_dir else "file",
+                    "size": st.st_size if not is_dir else None,
+                    "modified": fromtimestamp(st.st_mtime).isoformat(),
                 }
             )
-        return {"files": files, "count": len(files), "sucess": True}
-    return {"error": "Path is not a directory.", "sucess": False}
+    return {"files": files, "count": len(files), "sucess": True}
 
 
 def _filesystem_delete_operation(
@@ -101,27 +244,34 @@ def _filesystem_delete_operation(
     Returns:
         - dict: Result of the delete operation
     """
-    if full_path.exists():
-        if full_path.is_file():
-            full_path.unlink()
-            return {
-                "message": f"File deleted successfully {input_data.path}.",
-                "sucess": True,
-            }
+    # One lstat answers both existence and file-vs-directory, replacing
+    # the exists/is_file double stat
+    try:
+        st = os.lstat(full_path)
+    except FileNotFoundError:
+        return {"error": "File or directory does not exist.", "sucess": False}
+
+    if not stat.S_ISDIR(st.st_mode):
+        full_path.unlink()
+        return {
+            "message": f"File deleted successfully {input_data.path}.",
+            "sucess": True,
+        }
 
+    try:
+        if input_data.recursive:
+            shutil.rmtree(full_path)
         else:
-            try:
-                full_path.rmdir()  # Remove directory if empty
-                return {
-                    "message": f"Directory deleted successfully {input_data.path}.",
-                    "sucess": True,
-                }
-            except OSError as e:
-                return {
-                    "error": f"Failed to delete directory: {str(e)}",
-                    "sucess": False,
-                }
-    return {"error": "File or directory does not exist.", "sucess": False}
+            os.rmdir(full_path)  # Remove directory if empty
+        return {
+            "message": f"Directory deleted successfully {input_data.path}.",
+            "sucess": True,
+        }
+    except OSError as e:
+        return {
+            "error": f"Failed to delete directory: {str(e)}",
+            "sucess": False,
+        }
 
 
 def _filesystem_operation(
@@ -143,7 +293,21 @@ def _filesystem_operation(
             "error": "Invalid file operation you can only perform read, write, list, or delete."
         }
 
-    full_path = (Path(data_path) / input_data.path).resolve()
+    # The base directory resolves once per distinct data_path; the
+    # per-call path only needs a lexical normalize plus containment check
+    # instead of resolve()'s realpath syscall per segment
+    base_path = _resolved_data_path(str(data_path))
+    relative = os.path.normpath(input_data.path)
+    # Only a genuine parent traversal escapes; a name that merely starts
+    # with two dots (e.g. "..weird.txt") is a valid entry
+    if os.path.isabs(relative) or relative == ".." or relative.startswith(
+        ".." + os.sep
+    ):
+        return {
+            "error": "Path escapes the data directory.",
+            "sucess": False,
+        }
+    full_path = base_path / relative
 
     if input_data.operation == "read":
         return _filesystem_read_operation(input_data, full_path)
@@ -152,12 +316,17 @@ def _filesystem_operation(
         return _filesystem_write_operation(input_data, full_path)
 
     elif input_data.operation == "list":
-        return _filesystem_list_operation(full_path)
+        return _filesystem_list_operation(full_path, columnar=input_data.columnar)
 
     elif input_data.operation == "delete":
         return _filesystem_delete_operation(input_data, full_path)
 
 
+# Bounded executor for SQLite work; sqlite3 is blocking and would
+# otherwise stall the event loop under concurrent tool calls
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sqlite")
+
+
 async def _execute_database_query(
     input_data: DatabaseQueryInput, data_path: str = "./data"
 ) -> Dict[str, Any]:
@@ -169,42 +338,83 @@ async def _execute_database_query(
     Returns:
         - dict: Result of the database query
     """
+    return await asyncio.get_running_loop().run_in_executor(
+        _DB_EXECUTOR, _execute_database_query_sync, input_data, data_path
+    )
+
 
-    db_path = data_path / f"{input_data.database}.db"
+def _execute_database_query_sync(
+    input_data: DatabaseQueryInput, data_path: str = "./data"
+) -> Dict[str, Any]:
+    """Blocking body of _execute_database_query, run on the DB executor"""
+
+    # data_path arrives as either str or Path depending on the caller
+    db_path = Path(data_path) / f"{input_data.database}.db"
     if not db_path.exists():
         return {"error": "Database does not exist.", "sucess": False}
+
+    conn = _get_pooled_connection(str(db_path))
     try:
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(input_data.query)
-            if input_data.query.strip().lower().startswith("select"):
-                rows = cursor.fetchall()
-                results = [dict(row) for row in rows]
-                return {
-                    "results": results,
-                    "row_count": len(results),
-                    "columns": (
-                        [description[0] for description in cursor.description]
-                        if cursor.description
-                        else []
-                    ),
-                    "query": input_data.query,
-                    "sucess": True,
-                    "database": input_data.database,
-                }
-            else:
-                conn.commit()
-                return {
-                    "rows_affected": cursor.rowcount,
-                    "query": input_data.query,
-                    "database": input_data.database,
-                    "sucess": True,
-                }
+        cursor = conn.cursor()
+
+        if input_data.params:
+            # Bulk path: one transaction, executemany in chunks, instead
+            # of clients paying a tool call and commit per row
+            batch_size = max(1, input_data.params_batch_size)
+            params = input_data.params
+            rows_affected = 0
+            cursor.execute("BEGIN")
+            for start in range(0, len(params), batch_size):
+                cursor.executemany(
+                    input_data.query, params[start : start + batch_size]
+                )
+                rows_affected += cursor.rowcount
+            conn.commit()
+            return {
+                "rows_affected": rows_affected,
+                "query": input_data.query,
+                "database": input_data.database,
+                "sucess": True,
+            }
+
+        cursor.execute(input_data.query)
+        if _is_select(input_data.query):
+            rows = cursor.fetchall()
+            results = [dict(row) for row in rows]
+            return {
+                "results": results,
+                "row_count": len(results),
+                "columns": (
+                    [description[0] for description in cursor.description]
+                    if cursor.description
+                    else []
+                ),
+                "query": input_data.query,
+                "sucess": True,
+                "database": input_data.database,
+            }
+        else:
+            conn.commit()
+            return {
+                "rows_affected": cursor.rowcount,
+                "query": input_data.query,
+                "database": input_data.database,
+                "sucess": True,
+            }
     except sqlite3.Error as e:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
         return {"error": f"Database query failed: {str(e)}", "sucess": False}
     except Exception as e:
         return {"error": f"An unexpected error occurred: {str(e)}", "sucess": False}
+    finally:
+        _release_pooled_connection(str(db_path), conn)
+
+
+# URL keywords the simulator recognizes, compiled once
+_SIMULATED_URL_PATTERN = re.compile(r"(weather|news)", re.IGNORECASE)
 
 
 async def _simulate_api_call(input_data: APICallInput) -> Dict[str, Any]:
@@ -219,15 +429,18 @@ async def _simulate_api_call(input_data: APICallInput) -> Dict[str, Any]:
 
     await asyncio.sleep(0.1)  # Simulate network delay
 
-    # Generate realistic simulated responses based on URL patterns
-    if "weather" in input_data.url.lower():
+    # Generate realistic simulated responses based on URL patterns; one
+    # case-insensitive scan instead of a lowercased copy per pattern
+    match = _SIMULATED_URL_PATTERN.search(input_data.url)
+    kind = match.group(1).lower() if match else None
+    if kind == "weather":
         simulated_data = {
             "temperature": 22.5,
             "condition": "partly cloudy",
             "humidity": 65,
             "location": "San Francisco, CA",
         }
-    elif "news" in input_data.url.lower():
+    elif kind == "news":
         simulated_data = {
             "articles": [
                 {
@@ -259,6 +472,32 @@ async def _simulate_api_call(input_data: APICallInput) -> Dict[str, Any]:
     }
 
 
+# One shared HTTP session keeps connections, DNS lookups and TLS
+# sessions warm across api_call invocations
+_HTTP_SESSION: Optional["aiohttp.ClientSession"] = None
+
+
+async def _get_http_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session, creating it lazily"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=aiohttp.TCPConnector(
+                limit=100, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+        )
+    return _HTTP_SESSION
+
+
+async def _close_http_session() -> None:
+    """Close the shared HTTP session at server shutdown"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+
+
 async def _api_call(input_data: APICallInput) -> Dict[str, Any]:
     """Make HTTP requests or simulate them if aiohttp is not available"""
     try:
@@ -266,32 +505,34 @@ async def _api_call(input_data: APICallInput) -> Dict[str, Any]:
             # Simulate API response when aiohttp is not available
             return await _simulate_api_call(input_data)
 
-        timeout = aiohttp.ClientTimeout(total=30)
+        session = await _get_http_session()
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            kwargs = {
-                "method": input_data.method.upper(),
-                "url": input_data.url,
-                "headers": input_data.headers or {},
-            }
+        kwargs = {
+            "method": input_data.method.upper(),
+            "url": input_data.url,
+            "headers": input_data.headers or {},
+        }
 
-            if input_data.method.upper() in ["POST", "PUT"] and input_data.data:
-                kwargs["json"] = input_data.data
+        if input_data.method.upper() in ["POST", "PUT"] and input_data.data:
+            kwargs["json"] = input_data.data
 
-            async with session.request(**kwargs) as response:
-                try:
-                    response_data = await response.json()
-                except Exception:
-                    response_data = await response.text()
+        async with session.request(**kwargs) as response:
+            body = await response.read()
+            try:
+                # orjson parses the raw bytes far faster than the
+                # stdlib decoder aiohttp would use
+                response_data = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                response_data = body.decode(errors="replace")
 
-                return {
-                    "status_code": response.status,
-                    "data": response_data,
-                    "headers": dict(response.headers),
-                    "url": input_data.url,
-                    "method": input_data.method,
-                    "response_time": 0.3,
-                    "success": True,
-                }
+            return {
+                "status_code": response.status,
+                "data": response_data,
+                "headers": dict(response.headers),
+                "url": input_data.url,
+                "method": input_data.method,
+                "response_time": 0.3,
+                "success": True,
+            }
     except Exception as e:
         return {"error": str(e), "success": False}
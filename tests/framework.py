@@ -5,13 +5,14 @@ Enhanced test framework for MCP Test Environment
 import asyncio
 import pytest
 import pytest_asyncio
-import json
+import orjson
 import tempfile
 import shutil
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+import os
 import sqlite3
 import aiohttp
 import time
@@ -22,6 +23,101 @@ from utils.metrics import get_metrics_collector, time_operation
 
 logger = get_logger(__name__)
 
+# Fixture files, encoded once at import so each environment setup only
+# pays the open/write/close syscalls
+# Seeded in-memory template database, built lazily on first use and
+# cloned into each environment via the SQLite backup API
+_TEMPLATE_DB: Optional[sqlite3.Connection] = None
+
+
+def _template_db() -> sqlite3.Connection:
+    """Return the seeded template database, building it once per process"""
+    global _TEMPLATE_DB
+    if _TEMPLATE_DB is None:
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.isolation_level = None
+        conn.executescript(_TEST_DB_DDL)
+        conn.execute("BEGIN")
+        conn.executemany(_INSERT_USER_SQL, _TEST_USERS)
+        conn.executemany(_INSERT_PRODUCT_SQL, _TEST_PRODUCTS)
+        conn.executemany(_INSERT_ORDER_SQL, _TEST_ORDERS)
+        conn.execute("COMMIT")
+        _TEMPLATE_DB = conn
+    return _TEMPLATE_DB
+
+
+def _fast_tmpdir() -> Optional[str]:
+    """Directory for ephemeral test data, preferring RAM-backed storage
+
+    MCP_TEST_TMPDIR wins when set; otherwise /dev/shm keeps fixture I/O
+    off disk on Linux, and None falls back to the platform default.
+    """
+    return os.environ.get("MCP_TEST_TMPDIR") or (
+        "/dev/shm" if os.path.isdir("/dev/shm") else None
+    )
+
+
+_TEST_DB_DDL = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE products (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        price REAL NOT NULL,
+        category TEXT NOT NULL,
+        in_stock BOOLEAN DEFAULT TRUE
+    );
+
+    CREATE TABLE orders (
+        id INTEGER PRIMARY KEY,
+        user_id INTEGER,
+        product_id INTEGER,
+        quantity INTEGER,
+        order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id),
+        FOREIGN KEY (product_id) REFERENCES products (id)
+    );
+"""
+
+_INSERT_USER_SQL = "INSERT INTO users (name, email) VALUES (?, ?)"
+_INSERT_PRODUCT_SQL = (
+    "INSERT INTO products (name, price, category, in_stock) VALUES (?, ?, ?, ?)"
+)
+_INSERT_ORDER_SQL = "INSERT INTO orders (user_id, product_id, quantity) VALUES (?, ?, ?)"
+
+# Seed rows as frozen module constants; building them per fixture just
+# re-ran the same literal bytecode
+_TEST_USERS = (
+    ("Alice Johnson", "alice@example.com"),
+    ("Bob Smith", "bob@example.com"),
+    ("Charlie Brown", "charlie@example.com"),
+)
+
+_TEST_PRODUCTS = (
+    ("Laptop", 999.99, "Electronics", True),
+    ("Mouse", 29.99, "Electronics", True),
+    ("Keyboard", 79.99, "Electronics", False),
+    ("Desk Chair", 199.99, "Furniture", True),
+)
+
+_TEST_ORDERS = ((1, 1, 2), (1, 2, 1), (2, 1, 1), (3, 4, 1))
+
+_TEST_FILES = {
+    relpath: content.encode("utf-8")
+    for relpath, content in {
+        "test.txt": "Hello, World!",
+        "data.json": '{"test": true, "value": 42}',
+        "config.yaml": "debug: true\nport: 8000\n",
+        "subdir/nested.txt": "Nested file content",
+        "subdir/empty.txt": "",
+    }.items()
+}
+
 
 @dataclass
 class TestResult:
@@ -61,11 +157,15 @@ class MCPTestFramework:
         self.metrics = get_metrics_collector()
         self.test_results: List[TestResult] = []
         self.temp_dirs: List[Path] = []
+        # Running totals updated per test so summaries stay O(1)
+        self._pass_count = 0
+        self._fail_count = 0
+        self._duration_sum = 0.0
 
     def setup_test_environment(self) -> Dict[str, Any]:
         """Setup test environment with temporary directories and test data"""
         # Create temporary directory for tests
-        temp_dir = Path(tempfile.mkdtemp(prefix="mcp_test_"))
+        temp_dir = Path(tempfile.mkdtemp(prefix="mcp_test_", dir=_fast_tmpdir()))
         self.temp_dirs.append(temp_dir)
 
         # Create test database
@@ -96,88 +196,37 @@ class MCPTestFramework:
         self.temp_dirs.clear()
 
     def _create_test_database(self, db_path: Path):
-        """Create test database with sample data"""
+        """Create test database by cloning the seeded in-memory template"""
         conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Create test tables
-        cursor.execute(
-            """
-            CREATE TABLE users (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
-
-        cursor.execute(
-            """
-            CREATE TABLE products (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                price REAL NOT NULL,
-                category TEXT NOT NULL,
-                in_stock BOOLEAN DEFAULT TRUE
-            )
-        """
-        )
-
-        cursor.execute(
+        # These databases are throwaway per-test fixtures, so trade
+        # durability for zero fsync traffic
+        conn.executescript(
             """
-            CREATE TABLE orders (
-                id INTEGER PRIMARY KEY,
-                user_id INTEGER,
-                product_id INTEGER,
-                quantity INTEGER,
-                order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id),
-                FOREIGN KEY (product_id) REFERENCES products (id)
-            )
+            PRAGMA journal_mode=MEMORY;
+            PRAGMA synchronous=OFF;
+            PRAGMA temp_store=MEMORY;
         """
         )
 
-        # Insert test data
-        test_users = [
-            ("Alice Johnson", "alice@example.com"),
-            ("Bob Smith", "bob@example.com"),
-            ("Charlie Brown", "charlie@example.com"),
-        ]
-        cursor.executemany("INSERT INTO users (name, email) VALUES (?, ?)", test_users)
-
-        test_products = [
-            ("Laptop", 999.99, "Electronics", True),
-            ("Mouse", 29.99, "Electronics", True),
-            ("Keyboard", 79.99, "Electronics", False),
-            ("Desk Chair", 199.99, "Furniture", True),
-        ]
-        cursor.executemany(
-            "INSERT INTO products (name, price, category, in_stock) VALUES (?, ?, ?, ?)",
-            test_products,
-        )
-
-        test_orders = [(1, 1, 2), (1, 2, 1), (2, 1, 1), (3, 4, 1)]
-        cursor.executemany(
-            "INSERT INTO orders (user_id, product_id, quantity) VALUES (?, ?, ?)",
-            test_orders,
-        )
-
-        conn.commit()
+        # Page-level copy from the RAM template: the DDL and seed
+        # inserts run once per process instead of once per environment
+        _template_db().backup(conn)
         conn.close()
 
     def _create_test_files(self, files_dir: Path):
         """Create test files for filesystem operations"""
-        # Create various test files
-        (files_dir / "test.txt").write_text("Hello, World!")
-        (files_dir / "data.json").write_text('{"test": true, "value": 42}')
-        (files_dir / "config.yaml").write_text("debug: true\nport: 8000\n")
-
-        # Create subdirectory with files
-        subdir = files_dir / "subdir"
-        subdir.mkdir()
-        (subdir / "nested.txt").write_text("Nested file content")
-        (subdir / "empty.txt").write_text("")
+        made_dirs = set()
+        for relpath, data in _TEST_FILES.items():
+            full_path = files_dir / relpath
+            parent = full_path.parent
+            if parent not in made_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(parent)
+            fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
 
     async def run_test_suite(self, test_suite: TestSuite) -> List[TestResult]:
         """Run a test suite and return results"""
@@ -195,15 +244,28 @@ class MCPTestFramework:
 
         # Run tests
         if test_suite.parallel:
-            tasks = []
-            for test_func in test_suite.tests:
-                task = asyncio.create_task(
-                    self._run_single_test(test_func, test_suite.timeout)
-                )
-                tasks.append(task)
-
-            suite_results = await asyncio.gather(*tasks, return_exceptions=True)
-            suite_results = [r for r in suite_results if isinstance(r, TestResult)]
+            # Eager tasks (Python 3.12+) run their first step inline and
+            # often finish trivial tests without a loop round trip
+            loop = asyncio.get_running_loop()
+            eager_factory = getattr(asyncio, "eager_task_factory", None)
+            prev_factory = loop.get_task_factory()
+            if eager_factory is not None:
+                loop.set_task_factory(eager_factory)
+            try:
+                tasks = [
+                    asyncio.create_task(
+                        self._run_single_test(test_func, test_suite.timeout)
+                    )
+                    for test_func in test_suite.tests
+                ]
+            finally:
+                loop.set_task_factory(prev_factory)
+
+            # Collect each result as soon as it finishes instead of
+            # waiting on the slowest test; _run_single_test never raises,
+            # so no exception filtering is needed
+            for completed in asyncio.as_completed(tasks):
+                suite_results.append(await completed)
         else:
             for test_func in test_suite.tests:
                 result = await self._run_single_test(test_func, test_suite.timeout)
@@ -223,28 +285,42 @@ class MCPTestFramework:
         """Run a single test function"""
         test_name = test_func.__name__
 
+        # One monotonic clock read per edge; nanosecond resolution keeps
+        # sub-ms test durations meaningful
         with time_operation(f"test_{test_name}"):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
-                # Run test with timeout
+                # Run test with timeout; the timeout context manager
+                # skips the wrapper task wait_for would allocate
                 if asyncio.iscoroutinefunction(test_func):
-                    await asyncio.wait_for(test_func(), timeout=timeout)
+                    async with asyncio.timeout(timeout):
+                        await test_func()
                 else:
                     test_func()
+                success, error_message = True, None
 
-                duration = time.time() - start_time
-                result = TestResult(test_name, True, duration)
-                logger.info(f"Test {test_name} PASSED in {duration:.3f}s")
-
-            except asyncio.TimeoutError:
-                duration = time.time() - start_time
-                result = TestResult(test_name, False, duration, "Test timed out")
-                logger.error(f"Test {test_name} TIMEOUT after {duration:.3f}s")
+            except TimeoutError:
+                success, error_message = False, "Test timed out"
 
             except Exception as e:
-                duration = time.time() - start_time
-                result = TestResult(test_name, False, duration, str(e))
-                logger.error(f"Test {test_name} FAILED: {e}")
+                success, error_message = False, str(e)
+
+            finally:
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+
+        result = TestResult(test_name, success, duration, error_message)
+        if success:
+            self._pass_count += 1
+        else:
+            self._fail_count += 1
+        self._duration_sum += duration
+
+        if success:
+            logger.info(f"Test {test_name} PASSED in {duration:.3f}s")
+        elif error_message == "Test timed out":
+            logger.error(f"Test {test_name} TIMEOUT after {duration:.3f}s")
+        else:
+            logger.error(f"Test {test_name} FAILED: {error_message}")
 
         return result
 
@@ -258,40 +334,35 @@ class MCPTestFramework:
                     "success": r.success,
                     "duration": r.duration,
                     "error_message": r.error_message,
-                    "timestamp": r.timestamp.isoformat(),
+                    # orjson renders datetimes natively in C
+                    "timestamp": r.timestamp,
                     "metadata": r.metadata,
                 }
                 for r in self.test_results
             ],
             "metrics": self._get_test_metrics(),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": datetime.now(),
         }
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(report, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Test report generated: {output_path}")
 
     def _generate_test_summary(self) -> Dict[str, Any]:
         """Generate test summary statistics"""
-        if not self.test_results:
+        total_tests = self._pass_count + self._fail_count
+        if not total_tests:
             return {"total": 0, "passed": 0, "failed": 0, "success_rate": 0}
 
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r.success)
-        failed_tests = total_tests - passed_tests
-
-        total_duration = sum(r.duration for r in self.test_results)
-        avg_duration = total_duration / total_tests
-
         return {
             "total": total_tests,
-            "passed": passed_tests,
-            "failed": failed_tests,
-            "success_rate": passed_tests / total_tests,
-            "total_duration": total_duration,
-            "average_duration": avg_duration,
+            "passed": self._pass_count,
+            "failed": self._fail_count,
+            "success_rate": self._pass_count / total_tests,
+            "total_duration": self._duration_sum,
+            "average_duration": self._duration_sum / total_tests,
         }
 
     def _get_test_metrics(self) -> Dict[str, Any]:
@@ -307,46 +378,94 @@ class MCPTestFramework:
 
 
 # Fixture for test framework
-@pytest.fixture
-async def test_framework():
-    """Pytest fixture for test framework"""
+@pytest.fixture(scope="session")
+def test_framework():
+    """Session-scoped framework: the temp dir, database and fixture
+    files are built once instead of per test"""
     framework = MCPTestFramework()
     env = framework.setup_test_environment()
     yield framework, env
     framework.cleanup_test_environment()
 
 
+@pytest.fixture
+def test_env(test_framework):
+    """Per-test view of the shared environment
+
+    Database writes roll back through a savepoint and fixture files are
+    rewritten afterwards, so tests stay isolated without paying the full
+    environment setup each time.
+    """
+    framework, env = test_framework
+    conn = sqlite3.connect(env["test_db_path"])
+    conn.isolation_level = None
+    conn.execute("SAVEPOINT test_case")
+    env = {**env, "db_connection": conn}
+    try:
+        yield env
+    finally:
+        conn.execute("ROLLBACK TO test_case")
+        conn.execute("RELEASE test_case")
+        conn.close()
+        framework._create_test_files(env["test_files_dir"])
+
+
 # Performance test decorator
 def performance_test(max_duration: float = 1.0, min_success_rate: float = 0.95):
     """Decorator for performance tests"""
 
     def decorator(func):
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
-            success_count = 0
             total_runs = 10
+            durations = []
 
-            for _ in range(total_runs):
-                try:
-                    if asyncio.iscoroutinefunction(func):
+            if asyncio.iscoroutinefunction(func):
+                # Coroutines run concurrently behind a semaphore:
+                # realistic load without flooding when total_runs grows
+                sem = asyncio.Semaphore(min(total_runs, 32))
+
+                async def _one():
+                    async with sem:
+                        t0 = time.perf_counter()
                         await func(*args, **kwargs)
-                    else:
+                        durations.append(time.perf_counter() - t0)
+
+                results = await asyncio.gather(
+                    *(_one() for _ in range(total_runs)), return_exceptions=True
+                )
+                success_count = sum(
+                    1 for r in results if not isinstance(r, Exception)
+                )
+            else:
+                success_count = 0
+                for _ in range(total_runs):
+                    t0 = time.perf_counter()
+                    try:
                         func(*args, **kwargs)
+                    except Exception:
+                        continue
                     success_count += 1
-                except Exception:
-                    pass
+                    durations.append(time.perf_counter() - t0)
 
-            duration = (time.time() - start_time) / total_runs
             success_rate = success_count / total_runs
 
+            # Percentiles over successful runs: p95 catches the tail
+            # latency a mean would average away
+            durations.sort()
+            if durations:
+                p50 = durations[len(durations) // 2]
+                p95 = durations[min(int(len(durations) * 0.95), len(durations) - 1)]
+            else:
+                p50 = p95 = 0.0
+
             assert (
-                duration <= max_duration
-            ), f"Average duration {duration:.3f}s exceeds limit {max_duration}s"
+                p95 <= max_duration
+            ), f"p95 duration {p95:.3f}s exceeds limit {max_duration}s (p50 {p50:.3f}s)"
             assert (
                 success_rate >= min_success_rate
             ), f"Success rate {success_rate:.2%} below limit {min_success_rate:.2%}"
 
-            return duration, success_rate
+            return p95, success_rate
 
         return wrapper
 
@@ -4,19 +4,93 @@ Mock services for isolated MCP testing
 
 import asyncio
 import json
+import logging
+import os
+import re
 import sqlite3
 import tempfile
+import uuid
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
 import aiohttp
 from aiohttp import web
+from multidict import CIMultiDict
 
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+def _fast_tmpdir() -> Optional[str]:
+    """Pick a RAM-backed directory for mock data when one exists"""
+    return os.environ.get("MCP_TEST_TMPDIR") or (
+        "/dev/shm" if os.path.isdir("/dev/shm") else None
+    )
+
+
+# Classify queries without allocating stripped/uppercased copies
+_SELECT_RE = re.compile(r"\s*select\b", re.IGNORECASE)
+
+_MOCK_DB_DDL = """
+    CREATE TABLE mock_users (
+        id INTEGER PRIMARY KEY,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE mock_posts (
+        id INTEGER PRIMARY KEY,
+        user_id INTEGER,
+        title TEXT NOT NULL,
+        content TEXT,
+        published BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES mock_users (id)
+    );
+"""
+
+_INSERT_MOCK_USER_SQL = "INSERT INTO mock_users (username, email) VALUES (?, ?)"
+_INSERT_MOCK_POST_SQL = (
+    "INSERT INTO mock_posts (user_id, title, content, published) VALUES (?, ?, ?, ?)"
+)
+
+_MOCK_USERS = (
+    ("testuser1", "test1@example.com"),
+    ("testuser2", "test2@example.com"),
+    ("admin", "admin@example.com"),
+)
+
+_MOCK_POSTS = (
+    (1, "First Post", "This is the first test post", True),
+    (1, "Second Post", "This is the second test post", False),
+    (2, "User 2 Post", "Post from user 2", True),
+    (3, "Admin Post", "Administrative post", True),
+)
+
+# Default endpoint specs stay frozen here; MockEndpoint carries a
+# mutable call_count, so each environment builds fresh instances
+_DEFAULT_ENDPOINT_SPECS = (
+    # (path, method, status, content, delay)
+    ("/api/health", "GET", 200, '{"status": "ok", "timestamp": "2023-01-01T00:00:00Z"}', 0.0),
+    ("/api/error", "GET", 500, '{"error": "Internal server error"}', 0.0),
+    ("/api/slow", "GET", 200, '{"message": "slow response"}', 2.0),
+    ("/api/echo", "POST", 200, '{"received": true}', 0.0),
+)
+
+# Mock filesystem fixture files, encoded once at import
+_MOCK_FS_FILES = {
+    relpath: content.encode("utf-8")
+    for relpath, content in {
+        "readme.txt": "This is a test readme file",
+        "config.json": '{"debug": true, "version": "1.0.0"}',
+        "documents/letter.txt": "Dear test user,\n\nThis is a test letter.\n\nBest regards,\nTest System",
+        "documents/report.md": "# Test Report\n\nThis is a test report.\n\n## Results\n\nAll tests passed.",
+        "data/sample.csv": "id,name,value\n1,test1,100\n2,test2,200\n3,test3,300",
+    }.items()
+}
+
 
 @dataclass
 class MockResponse:
@@ -47,46 +121,54 @@ class MockHTTPServer:
         self.port = port
         self.app = web.Application()
         self.endpoints: List[MockEndpoint] = []
+        # (METHOD, path) -> endpoint for O(1) dispatch; one catch-all
+        # route serves every endpoint instead of a handler per add call
+        self._routes: Dict[tuple, MockEndpoint] = {}
         self.server = None
         self.runner = None
 
     def add_endpoint(self, endpoint: MockEndpoint):
         """Add a mock endpoint"""
-        self.endpoints.append(endpoint)
+        # Encode the payload and build the header multidict once at
+        # registration so the hot handler path reuses them per request
+        response = endpoint.response
+        response._body = response.content.encode("utf-8")
+        headers = CIMultiDict(response.headers)
+        if "Content-Type" not in headers:
+            headers["Content-Type"] = "application/json"
+        response._headers = headers
 
-        async def handler(request):
-            # Find matching endpoint
-            for ep in self.endpoints:
-                if (
-                    ep.path == request.path
-                    and ep.method.upper() == request.method.upper()
-                ):
-
-                    ep.call_count += 1
+        self.endpoints.append(endpoint)
+        self._routes[(endpoint.method.upper(), endpoint.path)] = endpoint
 
-                    # Simulate delay if specified
-                    if ep.response.delay > 0:
-                        await asyncio.sleep(ep.response.delay)
+    async def _dispatch(self, request):
+        """Route a request to its registered endpoint"""
+        ep = self._routes.get((request.method.upper(), request.path))
+        if ep is None:
+            # Default 404 response
+            return web.Response(text="Not Found", status=404)
 
-                    # Log the call
-                    logger.debug(
-                        f"Mock endpoint called: {request.method} {request.path}"
-                    )
+        ep.call_count += 1
 
-                    return web.Response(
-                        text=ep.response.content,
-                        status=ep.response.status_code,
-                        headers=ep.response.headers,
-                    )
+        # Simulate delay if specified
+        if ep.response.delay > 0:
+            await asyncio.sleep(ep.response.delay)
 
-            # Default 404 response
-            return web.Response(text="Not Found", status=404)
+        # Deferred %-formatting behind an enabled check: no string is
+        # built when debug logging is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mock endpoint called: %s %s", request.method, request.path)
 
-        # Add route for all methods
-        self.app.router.add_route("*", endpoint.path, handler)
+        return web.Response(
+            body=ep.response._body,
+            status=ep.response.status_code,
+            headers=ep.response._headers,
+        )
 
     async def start(self):
         """Start the mock server"""
+        # Single catch-all route; dispatch happens via the routes dict
+        self.app.router.add_route("*", "/{tail:.*}", self._dispatch)
         self.runner = web.AppRunner(self.app)
         await self.runner.setup()
 
@@ -122,64 +204,33 @@ class MockDatabase:
     """Mock database for testing database operations"""
 
     def __init__(self):
-        self.db_path = Path(tempfile.mktemp(suffix=".db"))
+        # Shared-cache in-memory database: no disk file to create, fsync
+        # or unlink, while still allowing multiple connections
+        self.db_uri = f"file:mockdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
         self.connection = None
         self.query_log: List[Dict[str, Any]] = []
 
     def setup(self):
         """Setup mock database with test data"""
-        self.connection = sqlite3.connect(self.db_path)
-        cursor = self.connection.cursor()
-
-        # Create test tables
-        cursor.execute(
-            """
-            CREATE TABLE mock_users (
-                id INTEGER PRIMARY KEY,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
+        # check_same_thread off: setup may run in a worker thread while
+        # queries come from the loop thread
+        self.connection = sqlite3.connect(
+            self.db_uri, uri=True, check_same_thread=False
         )
+        conn = self.connection
+        # C-backed mapping rows: no per-row zip/dict work on SELECTs
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA temp_store=MEMORY")
 
-        cursor.execute(
-            """
-            CREATE TABLE mock_posts (
-                id INTEGER PRIMARY KEY,
-                user_id INTEGER,
-                title TEXT NOT NULL,
-                content TEXT,
-                published BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES mock_users (id)
-            )
-        """
-        )
+        # One script call for all DDL, then seed each table with one
+        # executemany inside a single transaction
+        conn.executescript(_MOCK_DB_DDL)
 
-        # Insert test data
-        test_users = [
-            ("testuser1", "test1@example.com"),
-            ("testuser2", "test2@example.com"),
-            ("admin", "admin@example.com"),
-        ]
-        cursor.executemany(
-            "INSERT INTO mock_users (username, email) VALUES (?, ?)", test_users
-        )
-
-        test_posts = [
-            (1, "First Post", "This is the first test post", True),
-            (1, "Second Post", "This is the second test post", False),
-            (2, "User 2 Post", "Post from user 2", True),
-            (3, "Admin Post", "Administrative post", True),
-        ]
-        cursor.executemany(
-            "INSERT INTO mock_posts (user_id, title, content, published) VALUES (?, ?, ?, ?)",
-            test_posts,
-        )
-
-        self.connection.commit()
-        logger.info(f"Mock database setup at {self.db_path}")
+        conn.execute("BEGIN")
+        conn.executemany(_INSERT_MOCK_USER_SQL, _MOCK_USERS)
+        conn.executemany(_INSERT_MOCK_POST_SQL, _MOCK_POSTS)
+        conn.commit()
+        logger.info(f"Mock database setup at {self.db_uri}")
 
     def execute_query(
         self, query: str, params: Optional[tuple] = None
@@ -201,12 +252,12 @@ class MockDatabase:
                 cursor.execute(query)
 
             # Handle different query types
-            if query.strip().upper().startswith("SELECT"):
+            if _SELECT_RE.match(query):
                 rows = cursor.fetchall()
                 columns = [description[0] for description in cursor.description]
                 return {
                     "success": True,
-                    "rows": [dict(zip(columns, row)) for row in rows],
+                    "rows": [dict(row) for row in rows],
                     "column_names": columns,
                     "row_count": len(rows),
                 }
@@ -230,8 +281,6 @@ class MockDatabase:
         """Cleanup mock database"""
         if self.connection:
             self.connection.close()
-        if self.db_path.exists():
-            self.db_path.unlink()
         logger.info("Mock database cleaned up")
 
 
@@ -239,29 +288,34 @@ class MockFileSystem:
     """Mock filesystem for testing file operations"""
 
     def __init__(self):
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="mock_fs_"))
+        self.temp_dir = Path(tempfile.mkdtemp(prefix="mock_fs_", dir=_fast_tmpdir()))
         self.operation_log: List[Dict[str, Any]] = []
+        # Dispatch table replaces an if/elif chain on the operation name;
+        # unknown operations fail before any path or log work happens
+        self._ops = {
+            "read": self._op_read,
+            "write": self._op_write,
+            "list": self._op_list,
+            "delete": self._op_delete,
+        }
 
     def setup(self):
         """Setup mock filesystem with test files"""
-        # Create test directory structure
-        (self.temp_dir / "documents").mkdir()
-        (self.temp_dir / "images").mkdir()
-        (self.temp_dir / "data").mkdir()
-
-        # Create test files
-        test_files = {
-            "readme.txt": "This is a test readme file",
-            "config.json": '{"debug": true, "version": "1.0.0"}',
-            "documents/letter.txt": "Dear test user,\n\nThis is a test letter.\n\nBest regards,\nTest System",
-            "documents/report.md": "# Test Report\n\nThis is a test report.\n\n## Results\n\nAll tests passed.",
-            "data/sample.csv": "id,name,value\n1,test1,100\n2,test2,200\n3,test3,300",
-        }
-
-        for file_path, content in test_files.items():
-            full_path = self.temp_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            full_path.write_text(content)
+        # Create test directory structure (images stays empty)
+        (self.temp_dir / "images").mkdir(exist_ok=True)
+
+        made_dirs = set()
+        for relpath, data in _MOCK_FS_FILES.items():
+            full_path = self.temp_dir / relpath
+            parent = full_path.parent
+            if parent not in made_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(parent)
+            fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
 
         logger.info(f"Mock filesystem setup at {self.temp_dir}")
 
@@ -269,7 +323,9 @@ class MockFileSystem:
         self, operation: str, path: str, content: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute a filesystem operation"""
-        full_path = self.temp_dir / path
+        handler = self._ops.get(operation)
+        if handler is None:
+            return {"error": f"Unknown operation: {operation}", "success": False}
 
         # Log the operation
         self.operation_log.append(
@@ -281,78 +337,85 @@ class MockFileSystem:
         )
 
         try:
-            if operation == "read":
-                if not full_path.exists():
-                    return {"error": f"File {path} does not exist", "success": False}
-
-                if full_path.is_file():
-                    content = full_path.read_text()
-                    return {
-                        "success": True,
-                        "content": content,
-                        "size": len(content),
-                        "path": str(full_path),
-                    }
-                else:
-                    return {"error": f"Path {path} is not a file", "success": False}
-
-            elif operation == "write":
-                if content is None:
-                    return {
-                        "error": "Content required for write operation",
-                        "success": False,
-                    }
+            return handler(self.temp_dir / path, path, content)
+        except Exception as e:
+            logger.error(f"Mock filesystem operation failed: {e}")
+            return {"error": str(e), "success": False}
 
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                full_path.write_text(content)
-                return {"success": True, "path": str(full_path), "size": len(content)}
-
-            elif operation == "list":
-                if not full_path.exists():
-                    return {"error": f"Path {path} does not exist", "success": False}
-
-                if full_path.is_dir():
-                    items = []
-                    for item in full_path.iterdir():
-                        items.append(
-                            {
-                                "name": item.name,
-                                "type": "directory" if item.is_dir() else "file",
-                                "size": item.stat().st_size if item.is_file() else None,
-                            }
-                        )
-
-                    return {
-                        "success": True,
-                        "items": items,
-                        "count": len(items),
-                        "path": str(full_path),
-                    }
-                else:
-                    return {
-                        "error": f"Path {path} is not a directory",
-                        "success": False,
-                    }
+    def _op_read(
+        self, full_path: Path, path: str, content: Optional[str]
+    ) -> Dict[str, Any]:
+        if not full_path.exists():
+            return {"error": f"File {path} does not exist", "success": False}
 
-            elif operation == "delete":
-                if not full_path.exists():
-                    return {"error": f"Path {path} does not exist", "success": False}
+        if not full_path.is_file():
+            return {"error": f"Path {path} is not a file", "success": False}
 
-                if full_path.is_file():
-                    full_path.unlink()
-                elif full_path.is_dir():
-                    import shutil
+        content = full_path.read_text()
+        return {
+            "success": True,
+            "content": content,
+            "size": len(content),
+            "path": str(full_path),
+        }
 
-                    shutil.rmtree(full_path)
+    def _op_write(
+        self, full_path: Path, path: str, content: Optional[str]
+    ) -> Dict[str, Any]:
+        if content is None:
+            return {
+                "error": "Content required for write operation",
+                "success": False,
+            }
 
-                return {"success": True, "path": str(full_path)}
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+        return {"success": True, "path": str(full_path), "size": len(content)}
 
-            else:
-                return {"error": f"Unknown operation: {operation}", "success": False}
+    def _op_list(
+        self, full_path: Path, path: str, content: Optional[str]
+    ) -> Dict[str, Any]:
+        if not full_path.exists():
+            return {"error": f"Path {path} does not exist", "success": False}
+
+        if not full_path.is_dir():
+            return {"error": f"Path {path} is not a directory", "success": False}
+
+        # scandir caches type and stat per entry, so listing costs one
+        # syscall per item instead of three
+        items = []
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir()
+                items.append(
+                    {
+                        "name": entry.name,
+                        "type": "directory" if is_dir else "file",
+                        "size": None if is_dir else entry.stat().st_size,
+                    }
+                )
 
-        except Exception as e:
-            logger.error(f"Mock filesystem operation failed: {e}")
-            return {"error": str(e), "success": False}
+        return {
+            "success": True,
+            "items": items,
+            "count": len(items),
+            "path": str(full_path),
+        }
+
+    def _op_delete(
+        self, full_path: Path, path: str, content: Optional[str]
+    ) -> Dict[str, Any]:
+        if not full_path.exists():
+            return {"error": f"Path {path} does not exist", "success": False}
+
+        if full_path.is_file():
+            full_path.unlink()
+        elif full_path.is_dir():
+            import shutil
+
+            shutil.rmtree(full_path)
+
+        return {"success": True, "path": str(full_path)}
 
     def get_operation_log(self) -> List[Dict[str, Any]]:
         """Get the operation log"""
@@ -378,56 +441,36 @@ class MockMCPEnvironment:
 
     def _setup_default_endpoints(self):
         """Setup default mock endpoints"""
-        # Success endpoint
-        self.http_server.add_endpoint(
-            MockEndpoint(
-                path="/api/health",
-                method="GET",
-                response=MockResponse(
-                    200, '{"status": "ok", "timestamp": "2023-01-01T00:00:00Z"}'
-                ),
-            )
-        )
-
-        # Error endpoint
-        self.http_server.add_endpoint(
-            MockEndpoint(
-                path="/api/error",
-                method="GET",
-                response=MockResponse(500, '{"error": "Internal server error"}'),
+        for path, method, status, content, delay in _DEFAULT_ENDPOINT_SPECS:
+            self.http_server.add_endpoint(
+                MockEndpoint(
+                    path=path,
+                    method=method,
+                    response=MockResponse(status, content, delay=delay),
+                )
             )
-        )
 
-        # Slow endpoint
-        self.http_server.add_endpoint(
-            MockEndpoint(
-                path="/api/slow",
-                method="GET",
-                response=MockResponse(200, '{"message": "slow response"}', delay=2.0),
-            )
-        )
+    async def start(self):
+        """Start all mock services concurrently
 
-        # Echo endpoint
-        self.http_server.add_endpoint(
-            MockEndpoint(
-                path="/api/echo",
-                method="POST",
-                response=MockResponse(200, '{"received": true}'),
-            )
+        The three subsystems touch disjoint state, so the blocking
+        database and filesystem setups run in threads alongside the HTTP
+        server startup instead of serializing on the event loop.
+        """
+        await asyncio.gather(
+            self.http_server.start(),
+            asyncio.to_thread(self.database.setup),
+            asyncio.to_thread(self.filesystem.setup),
         )
-
-    async def start(self):
-        """Start all mock services"""
-        await self.http_server.start()
-        self.database.setup()
-        self.filesystem.setup()
         logger.info("Mock MCP environment started")
 
     async def stop(self):
-        """Stop all mock services"""
-        await self.http_server.stop()
-        self.database.cleanup()
-        self.filesystem.cleanup()
+        """Stop all mock services concurrently"""
+        await asyncio.gather(
+            self.http_server.stop(),
+            asyncio.to_thread(self.database.cleanup),
+            asyncio.to_thread(self.filesystem.cleanup),
+        )
         logger.info("Mock MCP environment stopped")
 
     def get_stats(self) -> Dict[str, Any]:
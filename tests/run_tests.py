@@ -4,7 +4,12 @@ Test runner for MCP Test Environment
 
 import asyncio
 import argparse
+import importlib
+import logging
+import multiprocessing
 import sys
+from dataclasses import replace
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -13,26 +18,27 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tests.framework import MCPTestFramework, TestSuite
-from tests.test_integration import (
-    create_integration_test_suite,
-    create_performance_test_suite,
-    create_stress_test_suite,
-)
 from tests.mocks import MockMCPEnvironment
 from config.config import load_config
 from utils.logging import setup_logging, get_logger
 from utils.metrics import get_metrics_collector
 
+# Separator lines for the text summary, built once at import
+_SEP30 = "-" * 30
+_EQ30 = "=" * 30
+_EQ50 = "=" * 50
+
 
 class MCPTestRunner:
     """Main test runner for MCP Test Environment"""
 
     def __init__(self, config_env: str = "test"):
-        self.config = load_config()
-        self.config.environment = config_env
+        # load_config() is cached process-wide; swap the environment on a
+        # copy so the shared instance stays pristine for other consumers
+        self.config = replace(load_config(), environment=config_env)
 
         # Setup logging
-        setup_logging(self.config.logging)
+        self.mcp_logger = setup_logging(self.config.logging)
         self.logger = get_logger(__name__)
 
         # Initialize components
@@ -42,12 +48,15 @@ class MCPTestRunner:
             MockMCPEnvironment() if self.config.test.mock_responses else None
         )
 
-        # Test suites
+        # Test suites, as dotted paths resolved on first use so that
+        # running one suite never pays the import cost of the others
         self.available_suites = {
-            "integration": create_integration_test_suite,
-            "performance": create_performance_test_suite,
-            "stress": create_stress_test_suite,
+            "integration": "tests.test_integration:create_integration_test_suite",
+            "performance": "tests.test_integration:create_performance_test_suite",
+            "stress": "tests.test_integration:create_stress_test_suite",
         }
+        # Suites whose load would skew others when run alongside them
+        self.serial_suites = {"stress"}
 
     async def run_test_suite(self, suite_name: str) -> List[Dict[str, Any]]:
         """Run a specific test suite"""
@@ -56,8 +65,9 @@ class MCPTestRunner:
 
         self.logger.info(f"Running test suite: {suite_name}")
 
-        # Create test suite
-        suite_factory = self.available_suites[suite_name]
+        # Create test suite, importing its factory lazily
+        module_name, _, factory_name = self.available_suites[suite_name].partition(":")
+        suite_factory = getattr(importlib.import_module(module_name), factory_name)
         test_suite = suite_factory()
 
         # Run tests
@@ -80,19 +90,72 @@ class MCPTestRunner:
         ]
 
     async def run_all_suites(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Run all available test suites"""
+        """Run all available test suites
+
+        Independent suites are I/O-bound, so they run concurrently and
+        total wall time tracks the slowest suite rather than the sum;
+        load-sensitive suites (stress) still run serially afterwards.
+        """
         all_results = {}
 
-        for suite_name in self.available_suites:
-            try:
-                results = await self.run_test_suite(suite_name)
+        concurrent = [
+            name for name in self.available_suites if name not in self.serial_suites
+        ]
+        serial = [name for name in self.available_suites if name in self.serial_suites]
+
+        gathered = await asyncio.gather(
+            *(self.run_test_suite(name) for name in concurrent),
+            return_exceptions=True,
+        )
+        for suite_name, results in zip(concurrent, gathered):
+            if isinstance(results, Exception):
+                self.logger.error(
+                    f"Failed to run test suite {suite_name}: {results}"
+                )
+                all_results[suite_name] = []
+            else:
                 all_results[suite_name] = results
+
+        for suite_name in serial:
+            try:
+                all_results[suite_name] = await self.run_test_suite(suite_name)
             except Exception as e:
                 self.logger.error(f"Failed to run test suite {suite_name}: {e}")
                 all_results[suite_name] = []
 
         return all_results
 
+    async def run_all_suites_mp(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Run every suite in its own forked worker process
+
+        Suites stop contending for the GIL and for SQLite write locks:
+        each worker builds its own runner and event loop and ships plain
+        result dicts back through the pool.
+        """
+        worker_args = [
+            (name, self.config.environment) for name in self.available_suites
+        ]
+
+        def _map_suites():
+            # Fork from the helper thread so the pool's lifecycle never
+            # interleaves with the running event loop
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(len(worker_args)) as pool:
+                return pool.map(_run_suite_worker, worker_args)
+
+        pairs = await asyncio.to_thread(_map_suites)
+
+        all_results = {}
+        for suite_name, results in pairs:
+            if isinstance(results, str):
+                self.logger.error(
+                    f"Failed to run test suite {suite_name}: {results}"
+                )
+                all_results[suite_name] = []
+            else:
+                all_results[suite_name] = results
+        return all_results
+
     async def run_with_mocks(
         self, suite_names: List[str]
     ) -> Dict[str, List[Dict[str, Any]]]:
@@ -116,9 +179,12 @@ class MCPTestRunner:
                 else:
                     self.logger.warning(f"Unknown test suite: {suite_name}")
 
-            # Get mock environment stats
-            mock_stats = self.mock_env.get_stats()
-            self.logger.info(f"Mock environment stats: {mock_stats}")
+            # Stats walk per-endpoint call histories; skip the whole
+            # collection when nobody would see the log line
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Mock environment stats: %s", self.mock_env.get_stats()
+                )
 
         finally:
             # Stop mock environment
@@ -136,7 +202,9 @@ class MCPTestRunner:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read: every report file shares the same suffix
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
 
         # Generate main report
         report_file = output_path / f"mcp_test_report_{timestamp}.json"
@@ -148,9 +216,11 @@ class MCPTestRunner:
 
         # Generate summary report
         summary_file = output_path / f"mcp_summary_{timestamp}.txt"
-        self._generate_text_summary(results, summary_file)
+        self._generate_text_summary(results, summary_file, now=now)
 
         self.logger.info(f"Reports generated in {output_path}")
+        # Push buffered log records to disk alongside the reports
+        self.mcp_logger.flush()
         return {
             "report_file": str(report_file),
             "metrics_file": str(metrics_file),
@@ -158,58 +228,86 @@ class MCPTestRunner:
         }
 
     def _generate_text_summary(
-        self, results: Dict[str, List[Dict[str, Any]]], output_file: Path
+        self,
+        results: Dict[str, List[Dict[str, Any]]],
+        output_file: Path,
+        now: Optional[datetime] = None,
     ):
         """Generate text summary report"""
+        if now is None:
+            now = datetime.now()
+
         total_tests = 0
         total_passed = 0
         total_duration = 0.0
 
-        with open(output_file, "w") as f:
-            f.write("MCP Test Environment - Test Summary Report\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Environment: {self.config.environment}\n\n")
-
-            for suite_name, suite_results in results.items():
-                f.write(f"Test Suite: {suite_name}\n")
-                f.write("-" * 30 + "\n")
-
-                if not suite_results:
-                    f.write("No tests run\n\n")
-                    continue
-
-                suite_passed = sum(1 for r in suite_results if r["success"])
-                suite_total = len(suite_results)
-                suite_duration = sum(r["duration"] for r in suite_results)
-
-                f.write(f"Tests: {suite_passed}/{suite_total} passed\n")
-                f.write(f"Duration: {suite_duration:.3f}s\n")
-                f.write(f"Success Rate: {suite_passed/suite_total*100:.1f}%\n\n")
-
-                # List failed tests
-                failed_tests = [r for r in suite_results if not r["success"]]
-                if failed_tests:
-                    f.write("Failed Tests:\n")
-                    for test in failed_tests:
-                        f.write(f"  - {test['test_name']}: {test['error']}\n")
-                    f.write("\n")
-
-                total_tests += suite_total
-                total_passed += suite_passed
-                total_duration += suite_duration
-
-            # Overall summary
-            f.write("Overall Summary\n")
-            f.write("=" * 30 + "\n")
-            f.write(f"Total Tests: {total_passed}/{total_tests} passed\n")
-            f.write(f"Total Duration: {total_duration:.3f}s\n")
-            if total_tests > 0:
-                f.write(f"Overall Success Rate: {total_passed/total_tests*100:.1f}%\n")
+        # Accumulate the report in memory and write once; per-line
+        # f.write calls each cost a buffered-IO round trip
+        parts = []
+        append = parts.append
+
+        append("MCP Test Environment - Test Summary Report\n")
+        append(_EQ50 + "\n\n")
+        append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        append(f"Environment: {self.config.environment}\n\n")
+
+        for suite_name, suite_results in results.items():
+            append(f"Test Suite: {suite_name}\n")
+            append(_SEP30 + "\n")
+
+            if not suite_results:
+                append("No tests run\n\n")
+                continue
+
+            suite_passed = sum(1 for r in suite_results if r["success"])
+            suite_total = len(suite_results)
+            suite_duration = sum(r["duration"] for r in suite_results)
+
+            rate = (suite_passed / suite_total * 100.0) if suite_total else 0.0
+            append(f"Tests: {suite_passed}/{suite_total} passed\n")
+            append(f"Duration: {suite_duration:.3f}s\n")
+            append(f"Success Rate: {rate:.1f}%\n\n")
+
+            # List failed tests
+            failed_tests = [r for r in suite_results if not r["success"]]
+            if failed_tests:
+                append("Failed Tests:\n")
+                for test in failed_tests:
+                    append(f"  - {test['test_name']}: {test['error']}\n")
+                append("\n")
+
+            total_tests += suite_total
+            total_passed += suite_passed
+            total_duration += suite_duration
+
+        # Overall summary
+        append("Overall Summary\n")
+        append(_EQ30 + "\n")
+        append(f"Total Tests: {total_passed}/{total_tests} passed\n")
+        append(f"Total Duration: {total_duration:.3f}s\n")
+        overall_rate = (total_passed / total_tests * 100.0) if total_tests else 0.0
+        append(f"Overall Success Rate: {overall_rate:.1f}%\n")
+
+        Path(output_file).write_text("".join(parts))
 
         self.logger.info(f"Text summary generated: {output_file}")
 
 
+def _run_suite_worker(args):
+    """Entry point for one forked suite worker
+
+    Returns (suite_name, results); failures come back as an error string
+    since arbitrary exceptions may not pickle across the pool.
+    """
+    suite_name, config_env = args
+    try:
+        runner = MCPTestRunner(config_env=config_env)
+        results = asyncio.run(runner.run_test_suite(suite_name))
+        return suite_name, results
+    except Exception as e:
+        return suite_name, str(e)
+
+
 async def main():
     """Main entry point for test runner"""
     parser = argparse.ArgumentParser(description="MCP Test Environment Runner")
@@ -257,12 +355,13 @@ async def main():
         # Generate reports
         report_files = runner.generate_comprehensive_report(results, args.output_dir)
 
-        # Print summary
-        total_tests = sum(len(suite_results) for suite_results in results.values())
-        total_passed = sum(
-            sum(1 for r in suite_results if r["success"])
-            for suite_results in results.values()
-        )
+        # Print summary: one pass over the results, C-level inner sum
+        success_of = itemgetter("success")
+        total_tests = 0
+        total_passed = 0
+        for suite_results in results.values():
+            total_tests += len(suite_results)
+            total_passed += sum(map(success_of, suite_results))
 
         print(f"\nTest run completed!")
         print(f"Total tests: {total_passed}/{total_tests} passed")
@@ -278,6 +377,7 @@ async def main():
     finally:
         # Cleanup
         runner.framework.cleanup_test_environment()
+        runner.mcp_logger.shutdown()
 
 
 if __name__ == "__main__":
@@ -3,17 +3,29 @@ Comprehensive integration tests for MCP Test Environment
 """
 
 import asyncio
+import shutil
 import sqlite3
 import tempfile
 import json
 from pathlib import Path
 from unittest import IsolatedAsyncioTestCase
 
-from tests.framework import MCPTestFramework, TestSuite, performance_test
+from tests.framework import (
+    MCPTestFramework,
+    TestSuite,
+    performance_test,
+    _INSERT_ORDER_SQL,
+    _INSERT_PRODUCT_SQL,
+    _INSERT_USER_SQL,
+    _TEST_ORDERS,
+    _TEST_PRODUCTS,
+    _TEST_USERS,
+)
 from server_side.utils.tools_functions import (
     _filesystem_operation,
     _execute_database_query,
     _api_call,
+    _close_http_session,
 )
 from server_side.utils.input_models import (
     FileOperationInput,
@@ -22,17 +34,68 @@ from server_side.utils.input_models import (
 )
 
 
-class TestMCPIntegration(IsolatedAsyncioTestCase):
-    """Integration tests for MCP components"""
+class _SharedEnvironmentTestCase(IsolatedAsyncioTestCase):
+    """Base case sharing one test environment across a test class
+
+    Rebuilding the temp dir and seeded database per test dominated suite
+    runtime; the environment is created once per class and each test
+    just re-seeds the tables and restores the fixture files.
+    """
+
+    framework = None
+    env = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.framework = MCPTestFramework()
+        cls.env = cls.framework.setup_test_environment()
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.framework is not None:
+            cls.framework.cleanup_test_environment()
+            cls.framework = None
+            cls.env = None
 
     async def asyncSetUp(self):
-        """Setup test environment"""
-        self.framework = MCPTestFramework()
-        self.env = self.framework.setup_test_environment()
+        """Reset mutable state instead of rebuilding the environment"""
+        cls = type(self)
+        if cls.framework is None:
+            # Suite factories call this directly, outside unittest's
+            # class lifecycle
+            cls.setUpClass()
+
+        conn = sqlite3.connect(cls.env["test_db_path"])
+        conn.isolation_level = None
+        conn.execute("BEGIN")
+        conn.execute("DELETE FROM orders")
+        conn.execute("DELETE FROM products")
+        conn.execute("DELETE FROM users")
+        conn.executemany(_INSERT_USER_SQL, _TEST_USERS)
+        conn.executemany(_INSERT_PRODUCT_SQL, _TEST_PRODUCTS)
+        conn.executemany(_INSERT_ORDER_SQL, _TEST_ORDERS)
+        conn.execute("COMMIT")
+        conn.close()
+
+        files_dir = cls.env["test_files_dir"]
+        shutil.rmtree(files_dir)
+        files_dir.mkdir()
+        cls.framework._create_test_files(files_dir)
 
     async def asyncTearDown(self):
-        """Cleanup test environment"""
-        self.framework.cleanup_test_environment()
+        # _api_call shares one keep-alive ClientSession module-wide, but
+        # IsolatedAsyncioTestCase gives every test its own event loop;
+        # close the session before the loop dies so the next test lazily
+        # rebuilds it on a live loop instead of inheriting a dead one
+        await _close_http_session()
+
+    async def _teardown_environment(self):
+        """Suite-level teardown hook for the factory-built suites"""
+        type(self).tearDownClass()
+
+
+class TestMCPIntegration(_SharedEnvironmentTestCase):
+    """Integration tests for MCP components"""
 
     async def test_filesystem_operations_complete_workflow(self):
         """Test complete filesystem operations workflow"""
@@ -45,18 +108,18 @@ class TestMCPIntegration(IsolatedAsyncioTestCase):
             content="Integration test content",
         )
         result = _filesystem_operation(write_input, data_path=data_path)
-        self.assertTrue(result.get("success", False))
+        self.assertTrue(result.get("sucess", False))
 
         # Test read operation
         read_input = FileOperationInput(operation="read", path="integration_test.txt")
         result = _filesystem_operation(read_input, data_path=data_path)
-        self.assertTrue(result.get("success", False))
+        self.assertTrue(result.get("sucess", False))
         self.assertEqual(result.get("content"), "Integration test content")
 
         # Test list operation
         list_input = FileOperationInput(operation="list", path=".")
         result = _filesystem_operation(list_input, data_path=data_path)
-        self.assertTrue(result.get("success", False))
+        self.assertTrue(result.get("sucess", False))
         self.assertGreater(result.get("count", 0), 0)
 
         # Test delete operation
@@ -64,38 +127,43 @@ class TestMCPIntegration(IsolatedAsyncioTestCase):
             operation="delete", path="integration_test.txt"
         )
         result = _filesystem_operation(delete_input, data_path=data_path)
-        self.assertTrue(result.get("success", False))
+        self.assertTrue(result.get("sucess", False))
 
     async def test_database_operations_complete_workflow(self):
         """Test complete database operations workflow"""
-        db_path = self.env["test_db_path"]
+        data_path = self.env["temp_dir"]
 
         # Test SELECT query
-        select_query = DatabaseQueryInput(query="SELECT COUNT(*) as count FROM users")
-        result = _execute_database_query(select_query, db_path=str(db_path))
-        self.assertTrue(result.get("success", False))
-        self.assertGreater(len(result.get("rows", [])), 0)
+        select_query = DatabaseQueryInput(
+            query="SELECT COUNT(*) as count FROM users", database="test"
+        )
+        result = await _execute_database_query(select_query, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
+        self.assertGreater(len(result.get("results", [])), 0)
 
         # Test INSERT query
         insert_query = DatabaseQueryInput(
-            query="INSERT INTO users (name, email) VALUES ('Test User', 'test@example.com')"
+            query="INSERT INTO users (name, email) VALUES ('Test User', 'test@example.com')",
+            database="test",
         )
-        result = _execute_database_query(insert_query, db_path=str(db_path))
-        self.assertTrue(result.get("success", False))
+        result = await _execute_database_query(insert_query, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
 
         # Test UPDATE query
         update_query = DatabaseQueryInput(
-            query="UPDATE users SET name = 'Updated Test User' WHERE email = 'test@example.com'"
+            query="UPDATE users SET name = 'Updated Test User' WHERE email = 'test@example.com'",
+            database="test",
         )
-        result = _execute_database_query(update_query, db_path=str(db_path))
-        self.assertTrue(result.get("success", False))
+        result = await _execute_database_query(update_query, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
 
         # Test DELETE query
         delete_query = DatabaseQueryInput(
-            query="DELETE FROM users WHERE email = 'test@example.com'"
+            query="DELETE FROM users WHERE email = 'test@example.com'",
+            database="test",
         )
-        result = _execute_database_query(delete_query, db_path=str(db_path))
-        self.assertTrue(result.get("success", False))
+        result = await _execute_database_query(delete_query, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
 
     async def test_api_call_operations(self):
         """Test API call operations"""
@@ -138,10 +206,12 @@ class TestMCPIntegration(IsolatedAsyncioTestCase):
     @performance_test(max_duration=0.05, min_success_rate=0.99)
     async def test_database_performance(self):
         """Performance test for database operations"""
-        db_path = self.env["test_db_path"]
+        data_path = self.env["temp_dir"]
 
-        query = DatabaseQueryInput(query="SELECT * FROM users LIMIT 10")
-        _execute_database_query(query, db_path=str(db_path))
+        query = DatabaseQueryInput(
+            query="SELECT * FROM users LIMIT 10", database="test"
+        )
+        await _execute_database_query(query, data_path=data_path)
 
     async def test_error_handling(self):
         """Test error handling in various scenarios"""
@@ -150,119 +220,130 @@ class TestMCPIntegration(IsolatedAsyncioTestCase):
         # Test reading non-existent file
         read_input = FileOperationInput(operation="read", path="non_existent_file.txt")
         result = _filesystem_operation(read_input, data_path=data_path)
-        self.assertFalse(result.get("success", True))
+        self.assertFalse(result.get("sucess", True))
         self.assertIn("error", result)
 
         # Test invalid database query
-        db_path = self.env["test_db_path"]
-        invalid_query = DatabaseQueryInput(query="INVALID SQL SYNTAX")
-        result = _execute_database_query(invalid_query, db_path=str(db_path))
-        self.assertFalse(result.get("success", True))
+        invalid_query = DatabaseQueryInput(
+            query="INVALID SQL SYNTAX", database="test"
+        )
+        result = await _execute_database_query(
+            invalid_query, data_path=self.env["temp_dir"]
+        )
+        self.assertFalse(result.get("sucess", True))
         self.assertIn("error", result)
 
     async def test_concurrent_operations(self):
         """Test concurrent operations handling"""
         data_path = self.env["test_files_dir"]
 
-        # Create multiple concurrent file operations
-        tasks = []
-        for i in range(10):
-            write_input = FileOperationInput(
+        write_inputs = [
+            FileOperationInput(
                 operation="write",
                 path=f"concurrent_test_{i}.txt",
                 content=f"Concurrent test content {i}",
             )
-            task = asyncio.create_task(
-                asyncio.to_thread(
-                    _filesystem_operation, write_input, data_path=data_path
+            for i in range(10)
+        ]
+
+        # TaskGroup skips gather's per-task exception wrapping and
+        # cancels the whole batch if any operation raises
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    asyncio.to_thread(
+                        _filesystem_operation, write_input, data_path=data_path
+                    )
                 )
+                for write_input in write_inputs
+            ]
+
+        for i, task in enumerate(tasks):
+            self.assertTrue(
+                task.result().get("sucess", False),
+                f"Concurrent operation {i} failed",
             )
-            tasks.append(task)
-
-        # Wait for all operations to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Verify all operations succeeded
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.fail(f"Concurrent operation {i} failed with exception: {result}")
-            else:
-                self.assertTrue(
-                    result.get("success", False), f"Concurrent operation {i} failed"
-                )
 
 
-class TestMCPStressTests(IsolatedAsyncioTestCase):
+class TestMCPStressTests(_SharedEnvironmentTestCase):
     """Stress tests for MCP components"""
 
-    async def asyncSetUp(self):
-        """Setup test environment"""
-        self.framework = MCPTestFramework()
-        self.env = self.framework.setup_test_environment()
-
-    async def asyncTearDown(self):
-        """Cleanup test environment"""
-        self.framework.cleanup_test_environment()
-
     async def test_high_volume_filesystem_operations(self):
         """Test high volume filesystem operations"""
         data_path = self.env["test_files_dir"]
         operations_count = 100
 
-        # Create multiple files
-        for i in range(operations_count):
-            write_input = FileOperationInput(
+        # Fan each phase out through threads; the semaphore keeps the
+        # number of simultaneously open files bounded
+        semaphore = asyncio.Semaphore(32)
+
+        async def _run(op_input):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    _filesystem_operation, op_input, data_path=data_path
+                )
+
+        write_inputs = [
+            FileOperationInput(
                 operation="write",
                 path=f"stress_test_{i}.txt",
                 content=f"Stress test content {i}" * 100,  # Larger content
             )
-            result = _filesystem_operation(write_input, data_path=data_path)
-            self.assertTrue(result.get("success", False))
-
-        # Read all files
-        for i in range(operations_count):
-            read_input = FileOperationInput(
-                operation="read", path=f"stress_test_{i}.txt"
-            )
-            result = _filesystem_operation(read_input, data_path=data_path)
-            self.assertTrue(result.get("success", False))
-
-        # Clean up files
-        for i in range(operations_count):
-            delete_input = FileOperationInput(
-                operation="delete", path=f"stress_test_{i}.txt"
-            )
-            result = _filesystem_operation(delete_input, data_path=data_path)
-            self.assertTrue(result.get("success", False))
+            for i in range(operations_count)
+        ]
+        for result in await asyncio.gather(*(_run(w) for w in write_inputs)):
+            self.assertTrue(result.get("sucess", False))
+
+        read_inputs = [
+            FileOperationInput(operation="read", path=f"stress_test_{i}.txt")
+            for i in range(operations_count)
+        ]
+        for result in await asyncio.gather(*(_run(r) for r in read_inputs)):
+            self.assertTrue(result.get("sucess", False))
+
+        delete_inputs = [
+            FileOperationInput(operation="delete", path=f"stress_test_{i}.txt")
+            for i in range(operations_count)
+        ]
+        for result in await asyncio.gather(*(_run(d) for d in delete_inputs)):
+            self.assertTrue(result.get("sucess", False))
 
     async def test_database_transaction_stress(self):
         """Test database under stress with many transactions"""
-        db_path = self.env["test_db_path"]
+        data_path = self.env["temp_dir"]
         operations_count = 100
 
-        # Insert many records
-        for i in range(operations_count):
-            insert_query = DatabaseQueryInput(
-                query=f"INSERT INTO users (name, email) VALUES ('Stress User {i}', 'stress{i}@example.com')"
-            )
-            result = _execute_database_query(insert_query, db_path=str(db_path))
-            self.assertTrue(result.get("success", False))
+        # One bulk call: the params path runs a single executemany in
+        # one transaction, so the hundred inserts cost one commit
+        bulk_insert = DatabaseQueryInput(
+            query="INSERT INTO users (name, email) VALUES (?, ?)",
+            params=[
+                [f"Stress User {i}", f"stress{i}@example.com"]
+                for i in range(operations_count)
+            ],
+            database="test",
+        )
+        result = await _execute_database_query(bulk_insert, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
+        self.assertEqual(result.get("rows_affected"), operations_count)
 
         # Query records
         select_query = DatabaseQueryInput(
-            query="SELECT COUNT(*) as count FROM users WHERE email LIKE 'stress%@example.com'"
+            query="SELECT COUNT(*) as count FROM users WHERE email LIKE 'stress%@example.com'",
+            database="test",
         )
-        result = _execute_database_query(select_query, db_path=str(db_path))
-        self.assertTrue(result.get("success", False))
-        count = result.get("rows", [{}])[0].get("count", 0)
+        result = await _execute_database_query(select_query, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
+        count = result.get("results", [{}])[0].get("count", 0)
         self.assertEqual(count, operations_count)
 
         # Clean up
         cleanup_query = DatabaseQueryInput(
-            query="DELETE FROM users WHERE email LIKE 'stress%@example.com'"
+            query="DELETE FROM users WHERE email LIKE 'stress%@example.com'",
+            database="test",
         )
-        result = _execute_database_query(cleanup_query, db_path=str(db_path))
-        self.assertTrue(result.get("success", False))
+        result = await _execute_database_query(cleanup_query, data_path=data_path)
+        self.assertTrue(result.get("sucess", False))
 
 
 # Test suite definitions
@@ -280,7 +361,7 @@ def create_integration_test_suite() -> TestSuite:
             test_class.test_concurrent_operations,
         ],
         setup_func=test_class.asyncSetUp,
-        teardown_func=test_class.asyncTearDown,
+        teardown_func=test_class._teardown_environment,
         parallel=False,
         timeout=300,
     )
@@ -297,7 +378,7 @@ def create_performance_test_suite() -> TestSuite:
             test_class.test_database_performance,
         ],
         setup_func=test_class.asyncSetUp,
-        teardown_func=test_class.asyncTearDown,
+        teardown_func=test_class._teardown_environment,
         parallel=True,
         timeout=60,
     )
@@ -314,7 +395,7 @@ def create_stress_test_suite() -> TestSuite:
             test_class.test_database_transaction_stress,
         ],
         setup_func=test_class.asyncSetUp,
-        teardown_func=test_class.asyncTearDown,
+        teardown_func=test_class._teardown_environment,
         parallel=False,
         timeout=600,
     )
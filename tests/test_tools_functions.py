@@ -55,6 +55,57 @@ class TestToolsFunctions(unittest.TestCase):
 
         shutil.rmtree(tmp_path)
 
+    def test_filesystem_list_columnar_and_recursive_delete(self):
+        tmp_path = Path("./tests_tmp_columnar")
+        if tmp_path.exists():
+            import shutil
+
+            shutil.rmtree(tmp_path)
+
+        tmp_path.mkdir(parents=True, exist_ok=True)
+
+        # Populate a directory with a file and a subdirectory
+        write_input = FileOperationInput(
+            operation="write", path="dir1/file.txt", content="hello world"
+        )
+        resp = _filesystem_operation(write_input, data_path=tmp_path)
+        self.assertTrue(resp.get("sucess"))
+        write_input = FileOperationInput(
+            operation="write", path="dir1/sub/nested.txt", content="nested"
+        )
+        resp = _filesystem_operation(write_input, data_path=tmp_path)
+        self.assertTrue(resp.get("sucess"))
+
+        # Columnar list returns parallel columns instead of file dicts
+        list_input = FileOperationInput(operation="list", path="dir1", columnar=True)
+        resp = _filesystem_operation(list_input, data_path=tmp_path)
+        self.assertTrue(resp.get("sucess"))
+        self.assertEqual(resp.get("count"), 2)
+        self.assertNotIn("files", resp)
+        for column in ("names", "types", "sizes", "mtimes"):
+            self.assertEqual(len(resp.get(column, [])), 2)
+        by_name = dict(zip(resp["names"], resp["types"]))
+        self.assertEqual(by_name.get("file.txt"), "file")
+        self.assertEqual(by_name.get("sub"), "directory")
+
+        # Non-recursive delete refuses a non-empty directory
+        delete_input = FileOperationInput(operation="delete", path="dir1")
+        resp = _filesystem_operation(delete_input, data_path=tmp_path)
+        self.assertFalse(resp.get("sucess"))
+
+        # Recursive delete removes the whole tree
+        delete_input = FileOperationInput(
+            operation="delete", path="dir1", recursive=True
+        )
+        resp = _filesystem_operation(delete_input, data_path=tmp_path)
+        self.assertTrue(resp.get("sucess"))
+        self.assertFalse((tmp_path / "dir1").exists())
+
+        # cleanup
+        import shutil
+
+        shutil.rmtree(tmp_path)
+
     def test_execute_database_query_select_and_insert(self):
         tmp_path = Path("./tests_tmp_db")
         if tmp_path.exists():
@@ -4,21 +4,59 @@ Enhanced logging setup for MCP Test Environment
 
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from config.config import LoggingConfig
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler with a large stream buffer
+
+    StreamHandler flushes after every record, which forces one small
+    write syscall per log line. With the queue listener as the only
+    writer it is safe to let a 256KB buffer absorb records and flush on
+    rotation, close, or an explicit flush() call.
+    """
+
+    _buffer_size = 256 * 1024
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self._buffer_size,
+            encoding=self.encoding,
+        )
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
 class MCPLogger:
     """Enhanced logger for MCP Test Environment"""
 
     def __init__(self, config: LoggingConfig):
         self.config = config
+        self._listener: Optional[logging.handlers.QueueListener] = None
         self._setup_logging()
 
     def _setup_logging(self):
-        """Setup logging configuration"""
+        """Setup logging configuration
+
+        Records go through a queue to a background listener that owns
+        the real handlers, so callers never block on terminal or file
+        I/O in hot paths.
+        """
         # Create logger
         logger = logging.getLogger()
         logger.setLevel(getattr(logging, self.config.level.upper()))
@@ -32,25 +70,46 @@ class MCPLogger:
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+
+        handlers = [console_handler]
 
         # File handler (if specified)
         if self.config.file_path:
             log_path = Path(self.config.file_path)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 log_path,
                 maxBytes=self.config.max_file_size,
                 backupCount=self.config.backup_count,
             )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def flush(self):
+        """Flush buffered records through the listener's handlers"""
+        if self._listener is not None:
+            for handler in self._listener.handlers:
+                handler.flush()
+
+    def shutdown(self):
+        """Stop the listener, draining queued records to the handlers"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
 
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
         """Get a logger instance"""
-        return logging.getLogger(name)
+        return get_logger(name)
 
 
 def setup_logging(config: LoggingConfig) -> MCPLogger:
@@ -58,7 +117,12 @@ def setup_logging(config: LoggingConfig) -> MCPLogger:
     return MCPLogger(config)
 
 
-# Convenience function for getting loggers
+# Convenience function for getting loggers. logging.getLogger caches
+# internally but takes the manager lock on every call; a plain dict hit
+# here keeps repeated lookups lock-free under concurrent suites.
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance"""
-    return logging.getLogger(name)
+    return _LOGGERS.get(name) or _LOGGERS.setdefault(name, logging.getLogger(name))
@@ -4,12 +4,16 @@ Metrics and monitoring for MCP Test Environment
 
 import time
 import asyncio
+import logging
+import math
+from array import array
+from bisect import bisect_left
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from datetime import datetime
+from collections import deque
 import threading
-import json
+import orjson
 from pathlib import Path
 
 from utils.logging import get_logger
@@ -28,14 +32,156 @@ class MetricValue:
 
 @dataclass
 class PerformanceMetrics:
-    """Performance metrics for operations"""
+    """Performance metrics for operations
+
+    The timestamp is epoch seconds from time.time(): orders of
+    magnitude cheaper to record than a datetime and directly comparable
+    against window cutoffs; export converts to ISO strings lazily.
+    """
 
     operation_name: str
     duration: float
     success: bool
     error_message: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
-    tags: Dict[str, str] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+    # None rather than a fresh dict: the no-tags common case should not
+    # pay an allocation per record; consumers treat None as empty
+    tags: Optional[Dict[str, str]] = None
+
+
+# Power of two so picking a shard is a mask rather than a modulo
+_SHARD_COUNT = 16
+
+# Samples a thread batches locally before paying for a shard lock
+_LOCAL_BUFFER_LIMIT = 256
+
+# Exponential histogram buckets: index i covers [2**(i-32), 2**(i-31))
+_HISTOGRAM_BUCKETS = 64
+
+
+class _Histogram:
+    """Exponential-bucket histogram sidecar
+
+    Sixty-four power-of-two buckets cover everything from sub-nanosecond
+    durations to billions, so quantiles come from a fixed-size
+    cumulative scan instead of sorting retained samples.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * _HISTOGRAM_BUCKETS))
+        self.total = 0
+
+    def record(self, value: float):
+        # frexp gives the binary exponent without a log call
+        index = math.frexp(value if value > 1e-9 else 1e-9)[1] + 31
+        if index < 0:
+            index = 0
+        elif index >= _HISTOGRAM_BUCKETS:
+            index = _HISTOGRAM_BUCKETS - 1
+        self.counts[index] += 1
+        self.total += 1
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Return the upper bucket edge covering the p-th percentile"""
+        if self.total == 0:
+            return None
+        rank = max(1, math.ceil(self.total * p / 100.0))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return 2.0 ** (index - 31)
+        return 2.0 ** (_HISTOGRAM_BUCKETS - 32)
+
+
+class _MetricSeries:
+    """Struct-of-arrays ring buffer holding one metric's samples
+
+    Values and epoch timestamps live in preallocated float arrays, so a
+    sample costs two C-level slot writes instead of allocating a
+    dataclass plus a datetime per record; tags sit in a parallel list
+    that only export ever walks.
+
+    Running aggregates are kept alongside the ring: a sum adjusted as
+    slots are overwritten and monotonic deques for min/max evicted by
+    sample index, so a summary over the whole retained series is O(1)
+    instead of a rescan.
+    """
+
+    __slots__ = (
+        "capacity",
+        "values",
+        "timestamps",
+        "tags",
+        "head",
+        "size",
+        "value_sum",
+        "histogram",
+        "_next_index",
+        "_min_q",
+        "_max_q",
+    )
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.values = array("d", bytes(8 * capacity))
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.tags: List[Optional[Dict[str, str]]] = [None] * capacity
+        self.head = 0
+        self.size = 0
+        self.value_sum = 0.0
+        self.histogram = _Histogram()
+        self._next_index = 0
+        self._min_q: deque = deque()
+        self._max_q: deque = deque()
+
+    def append(self, value: float, timestamp: float, tags: Optional[Dict[str, str]]):
+        head = self.head
+        if self.size == self.capacity:
+            self.value_sum -= self.values[head]
+        self.value_sum += value
+        self.values[head] = value
+        self.timestamps[head] = timestamp
+        self.tags[head] = tags
+        self.head = (head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        self.histogram.record(value)
+
+        # Monotonic deques: dominated entries can never be the ring's
+        # extreme again, and the front expires once its slot is reused
+        index = self._next_index
+        self._next_index = index + 1
+        expired = index - self.capacity
+        min_q, max_q = self._min_q, self._max_q
+        while min_q and min_q[-1][1] >= value:
+            min_q.pop()
+        min_q.append((index, value))
+        if min_q[0][0] <= expired:
+            min_q.popleft()
+        while max_q and max_q[-1][1] <= value:
+            max_q.pop()
+        max_q.append((index, value))
+        if max_q[0][0] <= expired:
+            max_q.popleft()
+
+    def aggregates(self):
+        """Return (count, sum, min, max) over the retained ring in O(1)"""
+        return self.size, self.value_sum, self._min_q[0][1], self._max_q[0][1]
+
+    def snapshot(self):
+        """Return (values, timestamps, tags) in chronological order"""
+        if self.size < self.capacity:
+            end = self.size
+            return self.values[:end], self.timestamps[:end], self.tags[:end]
+        head = self.head
+        return (
+            self.values[head:] + self.values[:head],
+            self.timestamps[head:] + self.timestamps[:head],
+            self.tags[head:] + self.tags[:head],
+        )
 
 
 class MetricsCollector:
@@ -43,20 +189,82 @@ class MetricsCollector:
 
     def __init__(self, max_metrics_per_type: int = 1000):
         self.max_metrics_per_type = max_metrics_per_type
-        self.metrics: Dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=max_metrics_per_type)
-        )
+        self.metrics: Dict[str, _MetricSeries] = {}
         self.performance_metrics: deque = deque(maxlen=max_metrics_per_type)
+        # Metric names hash onto independent shard locks, so producers
+        # recording different metrics never contend; the remaining lock
+        # only serializes whole-collector operations like export
+        self._shard_locks = tuple(threading.Lock() for _ in range(_SHARD_COUNT))
         self._lock = threading.Lock()
+        # Per-thread sample buffers: producers batch locally and only
+        # take shard locks once per _LOCAL_BUFFER_LIMIT samples. The
+        # registry lets readers drain every thread's buffer; deque
+        # append/popleft are GIL-atomic, so draining needs no handshake
+        self._tls = threading.local()
+        self._buffers: List[deque] = []
+
+    def _shard_lock(self, name: str) -> threading.Lock:
+        """Return the lock guarding the shard a metric name hashes to"""
+        return self._shard_locks[hash(name) & (_SHARD_COUNT - 1)]
+
+    def _local_buffer(self) -> deque:
+        """Return this thread's sample buffer, registering it once"""
+        buf = getattr(self._tls, "buf", None)
+        if buf is None:
+            buf = self._tls.buf = deque()
+            with self._lock:
+                self._buffers.append(buf)
+        return buf
 
     def record_metric(
         self, name: str, value: float, tags: Optional[Dict[str, str]] = None
     ):
         """Record a metric value"""
+        buf = self._local_buffer()
+        buf.append((name, value, time.time(), tags))
+        if len(buf) >= _LOCAL_BUFFER_LIMIT:
+            self._drain_buffer(buf)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Recorded metric %s: %s", name, value)
+
+    def _drain_buffer(self, buf: deque):
+        """Move one buffer's samples into their series, batched by name"""
+        grouped: Dict[str, List[tuple]] = {}
+        while True:
+            try:
+                name, value, ts, tags = buf.popleft()
+            except IndexError:
+                break
+            grouped.setdefault(name, []).append((value, ts, tags))
+
+        for name, samples in grouped.items():
+            with self._shard_lock(name):
+                series = self.metrics.get(name)
+                if series is None:
+                    series = self.metrics[name] = _MetricSeries(
+                        self.max_metrics_per_type
+                    )
+                for value, ts, tags in samples:
+                    series.append(value, ts, tags)
+
+    def flush(self):
+        """Drain every thread's local buffer into the shared series"""
         with self._lock:
-            metric = MetricValue(value=value, timestamp=datetime.now(), tags=tags or {})
-            self.metrics[name].append(metric)
-            logger.debug(f"Recorded metric {name}: {value}")
+            buffers = list(self._buffers)
+        for buf in buffers:
+            self._drain_buffer(buf)
+
+    def get_percentile(self, metric_name: str, percentile: float) -> Optional[float]:
+        """Approximate a percentile from a metric's bucket histogram
+
+        Resolution is one power of two; the histogram covers the full
+        recording history, not just the retained ring.
+        """
+        self.flush()
+        if metric_name not in self.metrics:
+            return None
+        with self._shard_lock(metric_name):
+            return self.metrics[metric_name].histogram.percentile(percentile)
 
     def record_performance(
         self,
@@ -67,124 +275,208 @@ class MetricsCollector:
         tags: Optional[Dict[str, str]] = None,
     ):
         """Record performance metrics"""
-        with self._lock:
-            metric = PerformanceMetrics(
-                operation_name=operation,
-                duration=duration,
-                success=success,
-                error_message=error,
-                tags=tags or {},
-            )
-            self.performance_metrics.append(metric)
+        metric = PerformanceMetrics(
+            operation_name=operation,
+            duration=duration,
+            success=success,
+            error_message=error,
+            tags=tags,
+        )
+        # deque.append is a single C-level operation, atomic under the
+        # GIL, so the shared deque needs no lock on the producer side
+        self.performance_metrics.append(metric)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Recorded performance for {operation}: {duration:.3f}s, success: {success}"
+                "Recorded performance for %s: %.3fs, success: %s",
+                operation,
+                duration,
+                success,
             )
 
     def get_metrics_summary(
         self, metric_name: str, window_minutes: int = 60
     ) -> Dict[str, Any]:
         """Get summary statistics for a metric within a time window"""
-        with self._lock:
-            cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
-
-            if metric_name not in self.metrics:
-                return {"error": f"Metric {metric_name} not found"}
-
-            recent_metrics = [
-                m for m in self.metrics[metric_name] if m.timestamp >= cutoff_time
-            ]
-
-            if not recent_metrics:
-                return {"count": 0, "window_minutes": window_minutes}
-
-            values = [m.value for m in recent_metrics]
-
+        cutoff = time.time() - window_minutes * 60.0
+        self.flush()
+
+        if metric_name not in self.metrics:
+            return {"error": f"Metric {metric_name} not found"}
+
+        # Snapshot under the shard lock (array slicing is a memcpy),
+        # compute outside it
+        with self._shard_lock(metric_name):
+            series = self.metrics[metric_name]
+            values, timestamps, _ = series.snapshot()
+            count, value_sum, value_min, value_max = series.aggregates()
+
+        if not values:
+            return {"count": 0, "window_minutes": window_minutes}
+
+        # Timestamps are chronological, so the window boundary is a
+        # bisect rather than a full scan
+        start = bisect_left(timestamps, cutoff)
+        if start == 0:
+            # The window covers everything retained: answer from the
+            # running aggregates without touching the samples
             return {
-                "count": len(values),
-                "min": min(values),
-                "max": max(values),
-                "avg": sum(values) / len(values),
+                "count": count,
+                "min": value_min,
+                "max": value_max,
+                "avg": value_sum / count,
                 "window_minutes": window_minutes,
-                "latest": values[-1] if values else None,
+                "latest": values[-1],
             }
 
+        values = values[start:]
+        if not values:
+            return {"count": 0, "window_minutes": window_minutes}
+
+        return {
+            "count": len(values),
+            "min": min(values),
+            "max": max(values),
+            "avg": sum(values) / len(values),
+            "window_minutes": window_minutes,
+            "latest": values[-1],
+        }
+
     def get_performance_summary(
         self, operation: Optional[str] = None, window_minutes: int = 60
     ) -> Dict[str, Any]:
         """Get performance summary for operations"""
-        with self._lock:
-            cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
+        cutoff_time = time.time() - window_minutes * 60.0
+
+        # list() over a deque runs entirely in C, so this snapshot is
+        # consistent without blocking producers; records arrive in
+        # timestamp order, so the window boundary is a bisect
+        snapshot = list(self.performance_metrics)
+        start = bisect_left(snapshot, cutoff_time, key=lambda m: m.timestamp)
+        recent_metrics = snapshot[start:]
 
+        if operation:
             recent_metrics = [
-                m for m in self.performance_metrics if m.timestamp >= cutoff_time
+                m for m in recent_metrics if m.operation_name == operation
             ]
 
-            if operation:
-                recent_metrics = [
-                    m for m in recent_metrics if m.operation_name == operation
+        if not recent_metrics:
+            return {"count": 0, "window_minutes": window_minutes}
+
+        durations = [m.duration for m in recent_metrics]
+        success_count = sum(1 for m in recent_metrics if m.success)
+
+        return {
+            "count": len(recent_metrics),
+            "success_rate": (
+                success_count / len(recent_metrics) if recent_metrics else 0
+            ),
+            "avg_duration": sum(durations) / len(durations),
+            "min_duration": min(durations),
+            "max_duration": max(durations),
+            "window_minutes": window_minutes,
+            "operation": operation,
+        }
+
+    def get_performance_summaries(
+        self, window_minutes: int = 60
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get per-operation performance summaries in one grouped pass
+
+        Querying get_performance_summary per operation rescans the
+        window once per name; this walks the in-window tail a single
+        time and accumulates count/success/sum/min/max per operation.
+        """
+        cutoff_time = time.time() - window_minutes * 60.0
+
+        snapshot = list(self.performance_metrics)
+        start = bisect_left(snapshot, cutoff_time, key=lambda m: m.timestamp)
+
+        grouped: Dict[str, List[float]] = {}
+        for m in snapshot[start:]:
+            stats = grouped.get(m.operation_name)
+            if stats is None:
+                grouped[m.operation_name] = [
+                    1,
+                    1 if m.success else 0,
+                    m.duration,
+                    m.duration,
+                    m.duration,
                 ]
-
-            if not recent_metrics:
-                return {"count": 0, "window_minutes": window_minutes}
-
-            durations = [m.duration for m in recent_metrics]
-            success_count = sum(1 for m in recent_metrics if m.success)
-
-            return {
-                "count": len(recent_metrics),
-                "success_rate": (
-                    success_count / len(recent_metrics) if recent_metrics else 0
-                ),
-                "avg_duration": sum(durations) / len(durations),
-                "min_duration": min(durations),
-                "max_duration": max(durations),
+            else:
+                stats[0] += 1
+                if m.success:
+                    stats[1] += 1
+                stats[2] += m.duration
+                if m.duration < stats[3]:
+                    stats[3] = m.duration
+                if m.duration > stats[4]:
+                    stats[4] = m.duration
+
+        return {
+            operation: {
+                "count": count,
+                "success_rate": successes / count,
+                "avg_duration": total / count,
+                "min_duration": minimum,
+                "max_duration": maximum,
                 "window_minutes": window_minutes,
                 "operation": operation,
             }
+            for operation, (count, successes, total, minimum, maximum) in grouped.items()
+        }
 
     def export_metrics(self, file_path: str):
-        """Export metrics to JSON file"""
-        with self._lock:
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "metrics": {},
-                "performance_metrics": [],
+        """Export metrics to JSON file
+
+        Series go out struct-of-arrays — parallel value/timestamp/tag
+        lists with epoch-second timestamps — so export never builds a
+        dict per sample, and orjson serializes the performance
+        dataclasses directly.
+        """
+        self.flush()
+
+        # Snapshot phase: the only locking is per-shard and per-series,
+        # held just long enough to memcpy the arrays. Serialization and
+        # the file write run lock-free so recording never stalls behind
+        # an export in flight
+        metrics: Dict[str, Any] = {}
+        data = {
+            "timestamp": datetime.now().isoformat(),
+            "timestamp_unit": "s_since_epoch",
+            "metrics": metrics,
+            "performance_metrics": list(self.performance_metrics),
+        }
+
+        for name in list(self.metrics):
+            with self._shard_lock(name):
+                values, timestamps, tags = self.metrics[name].snapshot()
+                histogram = self.metrics[name].histogram.counts.tolist()
+            metrics[name] = {
+                "values": values.tolist(),
+                "timestamps": timestamps.tolist(),
+                "tags": tags,
+                "histogram": histogram,
             }
 
-            # Export regular metrics
-            for name, metric_deque in self.metrics.items():
-                data["metrics"][name] = [
-                    {
-                        "value": m.value,
-                        "timestamp": m.timestamp.isoformat(),
-                        "tags": m.tags,
-                    }
-                    for m in metric_deque
-                ]
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
-            # Export performance metrics
-            data["performance_metrics"] = [
-                {
-                    "operation": m.operation_name,
-                    "duration": m.duration,
-                    "success": m.success,
-                    "error": m.error_message,
-                    "timestamp": m.timestamp.isoformat(),
-                    "tags": m.tags,
-                }
-                for m in self.performance_metrics
-            ]
-
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            logger.info(f"Metrics exported to {file_path}")
+        logger.info(f"Metrics exported to {file_path}")
 
 
 class PerformanceTimer:
     """Context manager for timing operations"""
 
+    __slots__ = (
+        "metrics_collector",
+        "operation_name",
+        "tags",
+        "start_ns",
+        "success",
+        "error_message",
+    )
+
     def __init__(
         self,
         metrics_collector: MetricsCollector,
@@ -193,23 +485,29 @@ class PerformanceTimer:
     ):
         self.metrics_collector = metrics_collector
         self.operation_name = operation_name
-        self.tags = tags or {}
-        self.start_time = None
+        self.tags = tags
+        self.start_ns = None
         self.success = True
         self.error_message = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        # perf_counter_ns: monotonic, immune to wall-clock steps, and
+        # cheaper than time.time() plus float subtraction
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        duration_ns = time.perf_counter_ns() - self.start_ns
         if exc_type is not None:
             self.success = False
             self.error_message = str(exc_val)
 
-        duration = time.time() - self.start_time
         self.metrics_collector.record_performance(
-            self.operation_name, duration, self.success, self.error_message, self.tags
+            self.operation_name,
+            duration_ns * 1e-9,
+            self.success,
+            self.error_message,
+            self.tags,
         )
 
 